@@ -0,0 +1,199 @@
+# src/core/_rpi_kernels.py
+
+"""
+Kernels numéricos puros do solver da Prova de Inclinação.
+
+Este módulo concentra as funções de cálculo extraídas de `rpi.py` que
+operam apenas sobre escalares float e arrays NumPy contíguos — sem I/O,
+sem objetos da calculadora e sem pandas. Mantê-las aqui isola o caminho
+quente do solver da camada de orquestração e deixa as assinaturas prontas
+para uma eventual compilação antecipada, caso um compilador de kernels
+venha a ser adicionado às dependências do projeto.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+def passo_newton_leve(calado_re: float, calado_vante: float,
+                      desloc_alvo: float, lcg_alvo: float, lpp: float,
+                      desloc_calc: float, lcb_calc: float,
+                      mtc_calc: float, lcf_calc: float,
+                      tpc_calc: float) -> Tuple[float, float]:
+    """
+    Executa um passo de Newton 2-D do sistema F(cr, cv) = 0 da condição de
+    navio leve, onde F = (deslocamento - alvo, momento trimante residual).
+
+    O Jacobiano analítico 2x2 é montado com o TPC (resposta do deslocamento
+    ao calado médio) e o MTC (resposta do momento ao trim) e invertido em
+    forma fechada. Os termos cruzados são nulos porque o incremento de trim
+    é distribuído em torno do LCF, o que não altera o deslocamento.
+
+    Args:
+        calado_re (float): Calado atual na perpendicular de ré [m].
+        calado_vante (float): Calado atual na perpendicular de vante [m].
+        desloc_alvo (float): Deslocamento alvo de navio leve [t].
+        lcg_alvo (float): LCG alvo de navio leve [m].
+        lpp (float): Comprimento entre perpendiculares [m].
+        desloc_calc (float): Deslocamento calculado na tentativa atual [t].
+        lcb_calc (float): LCB calculado na tentativa atual [m].
+        mtc_calc (float): MTC calculado na tentativa atual [t.m/cm].
+        lcf_calc (float): LCF calculado na tentativa atual [m].
+        tpc_calc (float): TPC calculado na tentativa atual [t/cm].
+
+    Returns:
+        Tuple[float, float]: Os novos calados de ré e de vante.
+    """
+    # Resíduos: deslocamento em falta [t] e momento trimante necessário [t.m]
+    residuo_desloc = desloc_alvo - desloc_calc
+    residuo_momento = desloc_alvo * (lcg_alvo - lcb_calc)
+
+    # Jacobiano analítico J = [[a, b], [c, d]]:
+    #   a = dDeslocamento/dCaladoMedio = 100*TPC [t/m]
+    #   d = dMomento/dTrim = 100*MTC [t.m/m]
+    # b = c = 0 porque o trim é aplicado em torno do LCF.
+    a = tpc_calc * 100.0
+    b = 0.0
+    c = 0.0
+    d = mtc_calc * 100.0
+
+    det = a * d - b * c
+    if det == 0.0:
+        return calado_re, calado_vante
+
+    # Inversa 2x2 em forma fechada aplicada ao vetor de resíduos
+    delta_calado_medio = (d * residuo_desloc - b * residuo_momento) / det
+    delta_trim = (-c * residuo_desloc + a * residuo_momento) / det
+
+    # Distribui o incremento: calado médio uniformemente, trim em torno do LCF
+    novo_calado_re = calado_re + delta_calado_medio - delta_trim * (lcf_calc / lpp)
+    novo_calado_vante = calado_vante + delta_calado_medio + delta_trim * (1.0 - (lcf_calc / lpp))
+
+    return novo_calado_re, novo_calado_vante
+
+
+def interp_bilinear(calados: np.ndarray, trims: np.ndarray, valores: np.ndarray,
+                    calado_medio: float, trim: float) -> np.ndarray:
+    """
+    Interpola bilinearmente uma grade de propriedades (calado médio x trim).
+
+    Args:
+        calados (np.ndarray): Eixo de calados médios da grade (crescente).
+        trims (np.ndarray): Eixo de trims da grade (crescente).
+        valores (np.ndarray): Array (n_props, n_cal, n_trim) com as
+                              propriedades em cada ponto da grade.
+        calado_medio (float): Calado médio do ponto a interpolar [m].
+        trim (float): Trim do ponto a interpolar [m].
+
+    Returns:
+        np.ndarray: Vetor (n_props,) com as propriedades interpoladas.
+    """
+    # Índices das células (limitados ao interior da grade)
+    i = int(np.clip(np.searchsorted(calados, calado_medio) - 1, 0, calados.size - 2))
+    j = int(np.clip(np.searchsorted(trims, trim) - 1, 0, trims.size - 2))
+
+    # Pesos bilineares
+    u = (calado_medio - calados[i]) / (calados[i + 1] - calados[i])
+    v = (trim - trims[j]) / (trims[j + 1] - trims[j])
+    u = min(max(u, 0.0), 1.0)
+    v = min(max(v, 0.0), 1.0)
+
+    # Soma ponderada dos 4 cantos para todas as propriedades de uma só vez
+    return ((1 - u) * (1 - v) * valores[:, i, j]
+            + u * (1 - v) * valores[:, i + 1, j]
+            + (1 - u) * v * valores[:, i, j + 1]
+            + u * v * valores[:, i + 1, j + 1])
+
+
+def interp_bilinear_lote(calados: np.ndarray, trims: np.ndarray, valores: np.ndarray,
+                         pontos_calado: np.ndarray, pontos_trim: np.ndarray) -> np.ndarray:
+    """
+    Versão em lote de `interp_bilinear`: interpola N pontos de uma só vez.
+
+    Args:
+        calados (np.ndarray): Eixo de calados médios da grade (crescente).
+        trims (np.ndarray): Eixo de trims da grade (crescente).
+        valores (np.ndarray): Array (n_props, n_cal, n_trim) da grade.
+        pontos_calado (np.ndarray): Calados médios dos N pontos [m].
+        pontos_trim (np.ndarray): Trims dos N pontos [m].
+
+    Returns:
+        np.ndarray: Array (n_props, N) com as propriedades interpoladas.
+    """
+    i = np.clip(np.searchsorted(calados, pontos_calado) - 1, 0, calados.size - 2)
+    j = np.clip(np.searchsorted(trims, pontos_trim) - 1, 0, trims.size - 2)
+
+    u = np.clip((pontos_calado - calados[i]) / (calados[i + 1] - calados[i]), 0.0, 1.0)
+    v = np.clip((pontos_trim - trims[j]) / (trims[j + 1] - trims[j]), 0.0, 1.0)
+
+    return ((1 - u) * (1 - v) * valores[:, i, j]
+            + u * (1 - v) * valores[:, i + 1, j]
+            + (1 - u) * v * valores[:, i, j + 1]
+            + u * v * valores[:, i + 1, j + 1])
+
+
+def batch_converge_leve(calado_re0: np.ndarray, calado_vante0: np.ndarray,
+                        desloc_alvo: np.ndarray, lcg_alvo: np.ndarray, lpp: float,
+                        calados: np.ndarray, trims: np.ndarray, valores: np.ndarray,
+                        n_iter: int = 30,
+                        tolerancia: float = 1e-4) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve em lote a condição de flutuação de N cenários independentes.
+
+    Cada cenário é um par (deslocamento alvo, LCG alvo); os passos de Newton
+    de todos os cenários avançam em conjunto, com as hidrostáticas vindas da
+    grade pré-calculada por interpolação bilinear em lote. Todo o laço opera
+    sobre arrays float64 — o equivalente vetorizado de paralelizar cenário a
+    cenário. Como o corretor tem convergência linear, o resíduo é verificado
+    a cada passo e o laço termina quando todos os cenários convergem.
+
+    Args:
+        calado_re0 (np.ndarray): Calados de ré iniciais dos N cenários [m].
+        calado_vante0 (np.ndarray): Calados de vante iniciais [m].
+        desloc_alvo (np.ndarray): Deslocamentos alvo [t].
+        lcg_alvo (np.ndarray): LCGs alvo [m].
+        lpp (float): Comprimento entre perpendiculares [m].
+        calados, trims, valores: A grade hidrostática (ver `interp_bilinear`).
+        n_iter (int): Número máximo de passos de Newton.
+        tolerancia (float): Tolerância relativa dos resíduos de deslocamento
+                            e de LCG para considerar um cenário convergido.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Calados de ré e de vante convergidos.
+    """
+    calado_re = np.array(calado_re0, dtype=np.float64)
+    calado_vante = np.array(calado_vante0, dtype=np.float64)
+
+    for _ in range(n_iter):
+        props = interp_bilinear_lote(
+            calados, trims, valores,
+            (calado_re + calado_vante) / 2.0,
+            calado_vante - calado_re
+        )
+        desloc, lcb, mtc, lcf, tpc = props[0], props[1], props[2], props[3], props[4]
+
+        residuo_desloc = desloc_alvo - desloc
+        residuo_momento = desloc_alvo * (lcg_alvo - lcb)
+
+        # Critério de parada: erros relativos de deslocamento e de LCG de
+        # todos os cenários abaixo da tolerância.
+        erro_desloc = np.divide(residuo_desloc, desloc_alvo,
+                                out=np.zeros_like(residuo_desloc),
+                                where=desloc_alvo != 0.0)
+        erro_lcg = (lcg_alvo - lcb) / lpp if lpp else np.zeros_like(lcb)
+        if np.all(np.abs(erro_desloc) < tolerancia) and np.all(np.abs(erro_lcg) < tolerancia):
+            break
+
+        # Jacobiano diagonal por cenário (ver passo_newton_leve); cenários com
+        # derivada nula recebem passo nulo.
+        a = tpc * 100.0
+        d = mtc * 100.0
+        delta_calado_medio = np.divide(residuo_desloc, a,
+                                       out=np.zeros_like(a), where=a != 0.0)
+        delta_trim = np.divide(residuo_momento, d,
+                               out=np.zeros_like(d), where=d != 0.0)
+
+        calado_re = calado_re + delta_calado_medio - delta_trim * (lcf / lpp)
+        calado_vante = calado_vante + delta_calado_medio + delta_trim * (1.0 - lcf / lpp)
+
+    return calado_re, calado_vante
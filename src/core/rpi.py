@@ -1,22 +1,203 @@
 # src/core/rpi.py
 
+import logging
+import math
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Tuple
-import copy
 import os
 
 import sys
 # Adicionar o diretório 'src' ao caminho para encontrar outros módulos
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.core.ch import InterpoladorCasco, PropriedadesHidrostaticas
+from src.core.ch import InterpoladorCasco, PropriedadesHidrostaticas, _deflexao_delta_z
 from src.core.teste import *
+from src.core._rpi_kernels import passo_newton_leve, interp_bilinear, batch_converge_leve
+
+# Logger do módulo: as mensagens de depuração dos loops internos são emitidas
+# em nível DEBUG, evitando o custo de formatação/flush do stdout em execuções
+# repetidas (ex: provas em lote).
+logger = logging.getLogger(__name__)
+
+# Leituras processadas como arrays estruturados (dispositivo x movimento):
+# campos float64 contíguos em vez de listas de dicionários, prontos para a
+# indexação vetorizada do cálculo de GM/VCG.
+_DTYPE_LEITURA_PENDULO = np.dtype([
+    ('media_max', 'f8'), ('media_min', 'f8'), ('media', 'f8')
+])
+_DTYPE_LEITURA_TUBO = np.dtype([
+    ('media_max_bb', 'f8'), ('media_min_bb', 'f8'), ('media_bb', 'f8'),
+    ('media_max_be', 'f8'), ('media_min_be', 'f8'), ('media_be', 'f8')
+])
+
+# Sequência padrão de movimentos da prova (pesos A=0, B=1, C=2, D=3):
+# B, C, C(volta), B(volta), A, D, A(volta), D(volta)
+_SEQUENCIA_MOVIMENTOS = (1, 2, 2, 1, 0, 3, 0, 3)
+
+
+def _montar_tabela_sinais(sequencia: Tuple[int, ...], n_pesos: int) -> np.ndarray:
+    """
+    Constrói a tabela de sinais acumulados dos TCGs (movimentos x pesos).
+
+    Cada movimento inverte o sinal do TCG de um único peso; a linha k da
+    tabela é a linha k-1 com esse sinal invertido. O estado completo cabe
+    em int8 (±1), compacto e amigo da cache.
+    """
+    sinais = np.ones((len(sequencia) + 1, n_pesos), dtype=np.int8)
+    for k, idx_peso in enumerate(sequencia, start=1):
+        sinais[k] = sinais[k - 1]
+        sinais[k, idx_peso] = -sinais[k, idx_peso]
+    return sinais
+
+
+# Tabela pré-computada em tempo de import para a prova padrão de 4 pesos
+_SINAIS_MOVIMENTOS = _montar_tabela_sinais(_SEQUENCIA_MOVIMENTOS, 4)
+
+# Entradas escalares da prova num único vetor float64 contíguo, construído
+# uma vez no __init__ (ver _coerce_numeric). Os grupos de três entradas
+# consecutivas (ré, meio, vante) permitem ler blocos inteiros por fatia,
+# sem lookups de dicionário nos métodos de cálculo. As densidades vêm do
+# dicionário 'densidades_medidas' e entram com o prefixo 'dens_'.
+_INPUT_KEYS = (
+    'lr', 'lm', 'lv',
+    'bb_re', 'bb_meio', 'bb_vante',
+    'be_re', 'be_meio', 'be_vante',
+    'pontal_re', 'pontal_meio', 'pontal_vante',
+    'bl_bb_re', 'bl_bb_meio', 'bl_bb_vante',
+    'bl_be_re', 'bl_be_meio', 'bl_be_vante',
+    'dens_re', 'dens_meio', 'dens_vante',
+)
+_IDX_LR, _IDX_LM, _IDX_LV = 0, 1, 2
+_IDX_BB_RE, _IDX_BB_MEIO, _IDX_BB_VANTE = 3, 4, 5
+_IDX_BE_RE, _IDX_BE_MEIO, _IDX_BE_VANTE = 6, 7, 8
+_IDX_PONTAL_RE, _IDX_PONTAL_MEIO, _IDX_PONTAL_VANTE = 9, 10, 11
+_IDX_BL_BB_RE, _IDX_BL_BB_MEIO, _IDX_BL_BB_VANTE = 12, 13, 14
+_IDX_BL_BE_RE, _IDX_BL_BE_MEIO, _IDX_BL_BE_VANTE = 15, 16, 17
+_IDX_DENS_RE, _IDX_DENS_MEIO, _IDX_DENS_VANTE = 18, 19, 20
+
+# Rótulos de diagnóstico indexados por sinal (-1, 0, +1) -> posições (0, 1, 2):
+# a seleção vira um fancy-index sem ramos, reutilizável em lote sobre arrays
+# de deflexões/trims. Deflexão nula reporta-se como Sagging, como no texto
+# condicional original.
+_ROTULOS_DEFLEXAO = (
+    "Hogging (Alquebramento)",
+    "Sagging (Contra-alquebramento)",
+    "Sagging (Contra-alquebramento)",
+)
+_ROTULOS_TRIM = ("Trim pela Proa", "Sem Trim", "Trim pela Popa")
+
+# Combinações lineares dos calados [HPR, HPV, HMN, HMR, HMV] que produzem
+# (calado médio, deflexão, trim) num único produto matriz-vetor.
+_MATRIZ_CARACTERISTICAS = np.array([
+    [0.5, 0.5, 0.0, 0.0, 0.0],    # calado médio = (HPR + HPV) / 2
+    [-0.5, -0.5, 1.0, 0.0, 0.0],  # deflexão = HMN - calado médio
+    [0.0, 0.0, 0.0, 1.0, -1.0],   # trim = HMR - HMV
+])
+
+
+@dataclass(slots=True)
+class CaladosPerpendiculares:
+    """Calados corrigidos para as perpendiculares de ré, meio-navio e vante."""
+    re: float
+    meio: float
+    vante: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Retorna os calados num dicionário, para relatórios e serialização."""
+        return {"re": self.re, "meio": self.meio, "vante": self.vante}
+
+
+@dataclass(slots=True)
+class HidrostaticosProva:
+    """Propriedades hidrostáticas da embarcação na condição da prova."""
+    deslocamento: float
+    volume: float
+    lcb: float
+    vcb: float
+    kmt: float
+    mtc: float
+    lcg: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Retorna as propriedades num dicionário, para relatórios e serialização."""
+        return {
+            "Deslocamento": self.deslocamento,
+            "Volume": self.volume,
+            "LCB": self.lcb,
+            "VCB": self.vcb,
+            "KMt": self.kmt,
+            "MTc": self.mtc,
+            "LCG": self.lcg,
+        }
+
+
+@dataclass(slots=True)
+class NavioLeveResultados:
+    """Deslocamento, momentos e centro de gravidade na condição de navio leve."""
+    deslocamento: float
+    momento_long: float
+    momento_vert: float
+    lcg: float
+    vcg: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Retorna os resultados num dicionário, para relatórios e serialização."""
+        return {
+            'Deslocamento Leve (t)': self.deslocamento,
+            'Momento Long. Leve (t.m)': self.momento_long,
+            'Momento Vert. Leve (t.m)': self.momento_vert,
+            'LCG Leve (m)': self.lcg,
+            'VCG Leve (m)': self.vcg,
+        }
+
+
+@dataclass(slots=True)
+class FlutuacaoNavioLeve:
+    """Condição de flutuação (calados e trim) na condição de navio leve."""
+    calado_re: float
+    calado_vante: float
+    calado_medio: float
+    trim: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Retorna a condição de flutuação num dicionário, para relatórios."""
+        return {
+            'Calado na PP de Ré (m)': self.calado_re,
+            'Calado na PP de Vante (m)': self.calado_vante,
+            'Calado Médio (m)': self.calado_medio,
+            'Trim (m)': self.trim,
+        }
+
+
 
 class CalculadoraRPI:
     """
     Encapsula todos os cálculos relacionados com o Relatório da Prova de Inclinação.
     """
-    def __init__(self, dados_rpi: Dict[str, Any], dados_hidrostaticos: Dict[str, Any], df_hidrostatico: pd.DataFrame, casco_interpolado: InterpoladorCasco):
+    # __slots__ fixa o conjunto de atributos da instância: o acesso passa a
+    # ser um offset em C (sem hash do nome em __dict__), relevante nos loops
+    # que leem vários self.* por iteração, e reduz a pegada por instância.
+    __slots__ = (
+        'dados_rpi', 'dados_hidrostaticos', 'df_hidrostatico', 'casco', 'verbose',
+        'calados_nas_marcas', 'calados_nas_perpendiculares', 'densidade_media',
+        'total_deducoes', 'total_acrescimos',
+        '_tabela_deducoes_cache', '_tabela_acrescimos_cache',
+        'leituras_processadas', 'momentos_inclinantes',
+        'calado_medio', 'deflexao', 'trim',
+        'hidrostaticos_prova', 'propriedades_hidrostaticas_corrigidas',
+        'resultados_inclinacao', 'gm_prova', 'vcg_prova',
+        'navio_leve_resultados', 'flutuacao_navio_leve', 'hidrostaticos_navio_leve',
+        '_hg', '_trace_navio_leve',
+        '_pesos_prova_nomes', '_pesos_prova_peso', '_pesos_prova_tcg',
+        '_comprimentos', '_tipo_dispositivo',
+        '_cotas_x', '_cotas_y', '_cotas_z',
+        '_casco_corrigido_cache', '_casco_corrigido_chave',
+        '_densidade_done', '_pesos_done',
+        '_inputs',
+    )
+
+    def __init__(self, dados_rpi: Dict[str, Any], dados_hidrostaticos: Dict[str, Any], df_hidrostatico: pd.DataFrame, casco_interpolado: InterpoladorCasco, verbose: bool = False):
         """
         Inicializa a calculadora do RPI.
 
@@ -25,27 +206,32 @@ class CalculadoraRPI:
                                        recolhidos pelo menu.
             dados_hidrostaticos (Dict[str, Any]): O dicionário com os dados gerais
                                                   da embarcação (Lpp, etc.).
+            verbose (bool): Se True, imprime o traço de cada iteração do solver
+                            de navio leve; desligado por padrão, o traço fica
+                            disponível em `_trace_navio_leve` para inspeção.
         """
         self.dados_rpi = dados_rpi
         self.dados_hidrostaticos = dados_hidrostaticos
         self.df_hidrostatico = df_hidrostatico
         self.casco = casco_interpolado
+        self.verbose = verbose
         
         # Resultados que serão calculados
         self.calados_nas_marcas: Dict[str, float] = {}
-        self.calados_nas_perpendiculares: Dict[str, float] = {}
+        self.calados_nas_perpendiculares: CaladosPerpendiculares = None
         self.densidade_media: float = 0.0
         
-        # DataFrames para armazenar os detalhes dos pesos
-        self.tabela_deducoes = pd.DataFrame()
-        self.tabela_acrescimos = pd.DataFrame()
-
         # Dicionários para os totais
         self.total_deducoes: Dict[str, float] = {}
         self.total_acrescimos: Dict[str, float] = {}
 
-        # Lista para armazenar os dados processados das leituras
-        self.leituras_processadas = []
+        # Caches das tabelas detalhadas (montadas na primeira consulta)
+        self._tabela_deducoes_cache: pd.DataFrame = None
+        self._tabela_acrescimos_cache: pd.DataFrame = None
+
+        # Array estruturado (dispositivo x movimento) com as médias das
+        # leituras, preenchido por processar_leituras_inclinacao.
+        self.leituras_processadas: np.ndarray = None
 
         # Listas para armazenar os momentos calculados
         self.momentos_inclinantes: List[float] = []
@@ -55,16 +241,115 @@ class CalculadoraRPI:
         self.deflexao: float = 0.0
         self.trim: float = 0.0
 
-        self.hidrostaticos_prova: Dict[str, float] = {}
+        self.hidrostaticos_prova: HidrostaticosProva = None
 
         self.resultados_inclinacao = []
         self.gm_prova: float = 0.0
         self.vcg_prova: float = 0.0
 
-        self.navio_leve_resultados: Dict[str, float] = {}
+        self.navio_leve_resultados: NavioLeveResultados = None
+
+        # Grade hidrostática pré-calculada (calado x trim), construída sob
+        # demanda por _build_hidro_grid quando o solver a utiliza.
+        self._hg: Dict[str, np.ndarray] = None
 
         self.hidrostaticos_navio_leve: Dict[str, float] = {}
-        self.flutuacao_navio_leve: Dict[str, float] = {}
+        self.flutuacao_navio_leve: FlutuacaoNavioLeve = None
+
+        # Converte uma única vez as entradas numéricas (strings vindas do
+        # menu) para float: os métodos de cálculo e os filtros abaixo leem
+        # floats diretamente.
+        self._coerce_numeric()
+
+        # Filtro dos pesos da prova pré-compilado na ingestão: identifica uma
+        # única vez os itens cujo nome contém 'Peso da prova' e guarda os seus
+        # nomes, pesos e TCGs como ndarrays prontos para o cálculo de momentos.
+        itens_a_deduzir = self.dados_rpi.get('itens_a_deduzir', [])
+        nomes = np.array([item['nome'] for item in itens_a_deduzir], dtype=str)
+        if nomes.size:
+            mascara_prova = np.char.find(nomes, 'Peso da prova') >= 0
+        else:
+            mascara_prova = np.zeros(0, dtype=bool)
+        indices_prova = np.flatnonzero(mascara_prova)
+        self._pesos_prova_nomes: np.ndarray = nomes[mascara_prova]
+        self._pesos_prova_peso: np.ndarray = np.array(
+            [itens_a_deduzir[i]['peso'] for i in indices_prova], dtype=np.float64
+        )
+        self._pesos_prova_tcg: np.ndarray = np.array(
+            [itens_a_deduzir[i]['tcg'] for i in indices_prova], dtype=np.float64
+        )
+
+        # Cache dos dispositivos de medição (preenchido por _cache_comprimentos)
+        self._comprimentos: np.ndarray = None
+        self._tipo_dispositivo: np.ndarray = None
+
+        # Colunas da tabela de cotas em forma SoA (ndarrays contíguos): os
+        # consumidores do caminho quente leem os arrays diretamente e o
+        # DataFrame só é materializado quando uma nova tabela é necessária.
+        cotas = getattr(casco_interpolado, 'tabela_cotas', None)
+        if cotas is not None:
+            self._cotas_x: np.ndarray = cotas['x'].to_numpy()
+            self._cotas_y: np.ndarray = cotas['y'].to_numpy()
+            self._cotas_z: np.ndarray = cotas['z'].to_numpy()
+        else:
+            self._cotas_x = self._cotas_y = self._cotas_z = None
+
+        # Cache do casco corrigido pela deflexão (ver aplicar_correcao_deflexao)
+        self._casco_corrigido_cache: InterpoladorCasco = None
+        self._casco_corrigido_chave: Tuple[float, float] = None
+
+        # Flags de memoização: evitam recomputar (e reimprimir) a densidade
+        # média e as tabelas de pesos quando o orquestrador repete as chamadas.
+        self._densidade_done: bool = False
+        self._pesos_done: bool = False
+
+    def _coerce_numeric(self):
+        """
+        Converte os valores numéricos dos dicionários de entrada (recolhidos
+        como strings pelo menu) para float, uma única vez na construção.
+
+        Os valores são acomodados no vetor float64 contíguo `_inputs`, na
+        ordem fixa de `_INPUT_KEYS`; os métodos de cálculo leem por índice
+        inteiro (constantes `_IDX_*`) ou por fatia, evitando repetir
+        float() + lookups sobre as mesmas strings a cada invocação.
+        Entradas ausentes ou não numéricas (ex: o método de leitura, bordas
+        livres quando a leitura é direta) entram como 0.0.
+        """
+        origens: Dict[str, Any] = dict(self.dados_rpi.get('dados_flutuacao', {}))
+        for chave, valor in self.dados_rpi.get('densidades_medidas', {}).items():
+            origens['dens_' + chave] = valor
+
+        def _como_float(valor: Any) -> float:
+            try:
+                return float(valor)
+            except (TypeError, ValueError):
+                return 0.0
+
+        self._inputs = np.array(
+            [_como_float(origens.get(chave, 0.0)) for chave in _INPUT_KEYS],
+            dtype=np.float64
+        )
+
+        # As listas de itens também são convertidas uma vez: os campos
+        # numéricos de cada item viram float na ingestão e os consumidores
+        # (totais, tabelas, filtro de pesos da prova) leem valores nativos.
+        # Campos não convertíveis ficam como estão.
+        def _coerce_itens(lista: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            convertidos = []
+            for item in lista:
+                novo = dict(item)
+                for chave in ('peso', 'lcg', 'vcg', 'tcg'):
+                    if chave in novo:
+                        try:
+                            novo[chave] = float(novo[chave])
+                        except (TypeError, ValueError):
+                            pass
+                convertidos.append(novo)
+            return convertidos
+
+        for chave_lista in ('itens_a_deduzir', 'itens_a_acrescentar'):
+            if chave_lista in self.dados_rpi:
+                self.dados_rpi[chave_lista] = _coerce_itens(self.dados_rpi[chave_lista])
 
     def calcular_condicao_flutuacao(self):
         """
@@ -76,36 +361,35 @@ class CalculadoraRPI:
         metodo = dados_flutuacao['metodo']
 
         # --- Parte 1: Obter os calados médios nas marcas de leitura ---
-        HMR, HMM, HMV = 0.0, 0.0, 0.0 # Calados nas marcas: Ré, Meio, Vante
+        # As seis leituras (BB e BE em ré, meio e vante) são fatias contíguas
+        # do vetor de entradas, vistas como array (2 x 3) e reduzidas à média
+        # por coluna num único passe; os dois métodos diferem apenas na
+        # subtração dos pontais. Valores já convertidos uma vez no __init__.
+        entradas = self._inputs
 
         if "bordas livres" in metodo:
             print("-> A calcular calados a partir das bordas livres...")
-            # Média das bordas livres em cada ponto
-            bl_re = (float(dados_flutuacao['bl_bb_re']) + float(dados_flutuacao['bl_be_re'])) / 2
-            bl_meio = (float(dados_flutuacao['bl_bb_meio']) + float(dados_flutuacao['bl_be_meio'])) / 2
-            bl_vante = (float(dados_flutuacao['bl_bb_vante']) + float(dados_flutuacao['bl_be_vante'])) / 2
-
+            leituras = entradas[_IDX_BL_BB_RE:_IDX_BL_BE_VANTE + 1].reshape(2, 3)
+            pontais = entradas[_IDX_PONTAL_RE:_IDX_PONTAL_VANTE + 1]
             # Calado = Pontal no local - Borda Livre média
-            HMR = float(dados_flutuacao['pontal_re']) - bl_re
-            HMMN = float(dados_flutuacao['pontal_meio']) - bl_meio
-            HMV = float(dados_flutuacao['pontal_vante']) - bl_vante
-        
+            calados_medios = pontais - leituras.mean(axis=0)
+
         else: # "Leitura direta dos calados"
             print("-> A usar calados lidos diretamente...")
-            # Assume-se que a banda é desprezível, então a leitura de um bordo é a média.
-            HMR = (float(dados_flutuacao['bb_re']) + float(dados_flutuacao['be_re'])) / 2
-            HMMN = (float(dados_flutuacao['bb_meio']) + float(dados_flutuacao['be_meio'])) / 2
-            HMV = (float(dados_flutuacao['bb_vante']) + float(dados_flutuacao['be_vante'])) / 2
-        
-        self.calados_nas_marcas = {"re": HMR, "meio": HMM, "vante": HMV}
+            # Assume-se que a banda é desprezível, então a média dos bordos é o calado.
+            leituras = entradas[_IDX_BB_RE:_IDX_BE_VANTE + 1].reshape(2, 3)
+            calados_medios = leituras.mean(axis=0)
+
+        HMR, HMMN, HMV = calados_medios.tolist() # Calados nas marcas: Ré, Meio, Vante
+
+        self.calados_nas_marcas = dict(zip(("re", "meio", "vante"), calados_medios.tolist()))
         print(f"Calados médios nas marcas: Ré={HMR:.4f}m, Meio={HMMN:.4f}m, Vante={HMV:.4f}m")
 
         # --- Parte 2: Corrigir os calados para as perpendiculares ---
         print("-> A corrigir calados para as perpendiculares...")
         lpp = float(self.dados_hidrostaticos['lpp'])
-        LR = float(dados_flutuacao['lr'])
-        LM = float(dados_flutuacao['lm'])
-        LV = float(dados_flutuacao['lv'])
+        distancias = entradas[_IDX_LR:_IDX_LV + 1]
+        LR, LM, LV = distancias.tolist()
 
         # 1. Calcular TM (Trim Medido entre as marcas)
         TM = HMR - HMV
@@ -119,98 +403,162 @@ class CalculadoraRPI:
         # 3. Calcular tan_theta (tangente do ângulo de trim)
         tan_theta = TM / LRV
 
-        # 4. Correção para a Perpendicular de Ré (HPR)
-        dHPR = LR * tan_theta
-        HPR = HMR + dHPR
-
-        # 5. Correção para Meio-Navio (HMN)
-        dHMN = LM * tan_theta
-        HMN = HMMN + dHMN
-
-        # 6. Correção para a Perpendicular de Vante (HPV)
-        dHPV = LV * tan_theta
-        HPV = HMV - dHPV # NOTA: Usado sinal negativo. Se HMR > HMV (trim pela popa), o calado na PV é menor.
+        # 4. Aplicar as três correções (PR, MN e PV) numa única operação vetorial.
+        # Os sinais refletem a geometria: as marcas de ré e meio são corrigidas
+        # no sentido positivo e a de vante no negativo. Se HMR > HMV (trim pela
+        # popa), o calado na PV é menor.
+        sinais = np.array([1.0, 1.0, -1.0])
+        calados_marcas = np.array([HMR, HMMN, HMV])
+        calados_corrigidos = calados_marcas + sinais * distancias * tan_theta
+        HPR, HMN, HPV = calados_corrigidos.tolist()
 
-        self.calados_nas_perpendiculares = {"re": HPR, "meio": HMN, "vante": HPV}
+        self.calados_nas_perpendiculares = CaladosPerpendiculares(re=HPR, meio=HMN, vante=HPV)
         print(f"Calados corrigidos nas perpendiculares: PR={HPR:.4f}m, MN={HMN:.4f}m, PV={HPV:.4f}m")
 
     def calcular_densidade_media(self):
         """
         Calcula a densidade média da água e processa os itens a deduzir e a acrescentar.
         """
-        print("\n--- A calcular densidade e correção de pesos ---")
+        # Já calculada anteriormente: devolve o valor memoizado.
+        if self._densidade_done:
+            return self.densidade_media
 
-        # 1. Calcular a densidade média
-        densidades = self.dados_rpi['densidades_medidas']
-        d_re = float(densidades['re'])
-        d_meio = float(densidades['meio'])
-        d_vante = float(densidades['vante'])
+        print("\n--- A calcular densidade e correção de pesos ---")
 
-        self.densidade_media = (d_re + d_meio + d_vante) / 3
+        # 1. Calcular a densidade média (valores já convertidos no __init__,
+        # lidos como fatia contígua do vetor de entradas)
+        dens = self._inputs[_IDX_DENS_RE:_IDX_DENS_VANTE + 1]
+        self.densidade_media = (dens[0] + dens[1] + dens[2]) / 3
         print(f"-> Densidade média da água calculada: {self.densidade_media:.4f} t/m³")
 
+        self._densidade_done = True
         return self.densidade_media
 
-    def _processar_lista_de_itens(self, lista_itens: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, float]]:
+    def _processar_lista_de_itens(self, lista_itens: List[Dict[str, Any]], detailed: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, float]]:
         """
         Método auxiliar genérico para processar uma lista de itens (deduções ou acréscimos).
 
         Para uma dada lista de itens, ele calcula os momentos longitudinais e verticais
-        de cada um, retorna um DataFrame detalhado e um dicionário com os totais.
+        de cada um, retorna um dicionário de arrays NumPy e um dicionário com os totais.
+        Trabalhar diretamente com ndarrays evita o custo de construção e coerção de
+        tipos de um DataFrame; a tabela detalhada só é materializada sob demanda
+        pelas propriedades `tabela_deducoes`/`tabela_acrescimos`.
 
         Args:
             lista_itens (List[Dict[str, Any]]): A lista de itens a ser processada.
+            detailed (bool): Se False, devolve apenas os totais (colunas vazias),
+                             sem materializar os arrays por item.
 
         Returns:
-            Tuple[pd.DataFrame, Dict[str, float]]: Um DataFrame com os detalhes e
-                                                   um dicionário com os totais.
+            Tuple[Dict[str, np.ndarray], Dict[str, float]]: Um dicionário de colunas
+                                                            (ndarrays) e um dicionário
+                                                            com os totais.
         """
         if not lista_itens:
             # Se a lista estiver vazia, retorna estruturas vazias
-            return pd.DataFrame(), {"peso": 0.0, "momento_long": 0.0, "momento_vert": 0.0}
+            return {}, {"peso": 0.0, "momento_long": 0.0, "momento_vert": 0.0}
+
+        if not detailed:
+            # Caminho rápido só com totais: math.fsum é uma redução em C com
+            # compensação de erro, sem alocar as colunas por item. Os campos
+            # numéricos já foram convertidos para float na ingestão.
+            totais = {
+                "peso": math.fsum(item['peso'] for item in lista_itens),
+                "momento_long": math.fsum(
+                    item['peso'] * item['lcg'] for item in lista_itens
+                ),
+                "momento_vert": math.fsum(
+                    item['peso'] * item['vcg'] for item in lista_itens
+                ),
+            }
+            return {}, totais
+
+        # Empilha os valores numéricos num único array (n, 3): uma só alocação
+        # (os campos já chegam como float da ingestão).
+        arr = np.fromiter(
+            (item[chave] for item in lista_itens for chave in ('peso', 'lcg', 'vcg')),
+            dtype=np.float64,
+            count=3 * len(lista_itens)
+        ).reshape(-1, 3)
+
+        peso = arr[:, 0]
+        # Momentos de cada item via um único broadcast coluna a coluna
+        momento_long = peso * arr[:, 1]
+        momento_vert = peso * arr[:, 2]
+
+        colunas = {
+            # dtype=object evita a cópia para um array unicode de largura
+            # fixa: o pandas guardaria os nomes como object de qualquer forma.
+            'nome': np.array([item.get('nome', '') for item in lista_itens], dtype=object),
+            'peso': peso,
+            'lcg': arr[:, 1],
+            'vcg': arr[:, 2],
+            'momento_long': momento_long,
+            'momento_vert': momento_vert,
+        }
+        totais = {
+            "peso": float(peso.sum()),
+            "momento_long": float(momento_long.sum()),
+            "momento_vert": float(momento_vert.sum())
+        }
 
-        # Converte a lista de dicionários num DataFrame do pandas
-        df = pd.DataFrame(lista_itens)
+        return colunas, totais
 
-        # Converte as colunas para tipos numéricos para garantir que os cálculos funcionam
-        df['peso'] = pd.to_numeric(df['peso'])
-        df['lcg'] = pd.to_numeric(df['lcg'])
-        df['vcg'] = pd.to_numeric(df['vcg'])
-        
-        # Calcula os momentos para cada item
-        df['momento_long'] = df['peso'] * df['lcg']
-        df['momento_vert'] = df['peso'] * df['vcg']
+    @property
+    def tabela_deducoes(self) -> pd.DataFrame:
+        """
+        Tabela detalhada dos itens a deduzir.
 
-        # Calcula os totais somando as colunas do DataFrame
-        totais = {
-            "peso": df['peso'].sum(),
-            "momento_long": df['momento_long'].sum(),
-            "momento_vert": df['momento_vert'].sum()
-        }
-        
-        return df, totais
+        Construída na primeira consulta e memoizada: o caminho de cálculo só
+        consome os totais, então o DataFrame nunca é montado se nenhum
+        relatório o pedir.
+        """
+        if self._tabela_deducoes_cache is None:
+            colunas, _ = self._processar_lista_de_itens(self.dados_rpi.get('itens_a_deduzir', []))
+            self._tabela_deducoes_cache = pd.DataFrame(colunas)
+        return self._tabela_deducoes_cache
+
+    @property
+    def tabela_acrescimos(self) -> pd.DataFrame:
+        """
+        Tabela detalhada dos itens a acrescentar.
+
+        Construída na primeira consulta e memoizada, como `tabela_deducoes`.
+        """
+        if self._tabela_acrescimos_cache is None:
+            colunas, _ = self._processar_lista_de_itens(self.dados_rpi.get('itens_a_acrescentar', []))
+            self._tabela_acrescimos_cache = pd.DataFrame(colunas)
+        return self._tabela_acrescimos_cache
 
     def calcular_pesos_e_momentos(self):
         """
         Processa as listas de pesos a deduzir e a acrescentar para encontrar os
         seus pesos e momentos totais.
         """
+        # As tabelas já foram montadas: evita repetir a construção dos
+        # DataFrames (a parte cara de _processar_lista_de_itens).
+        if self._pesos_done:
+            return
+
         print("\n--- A calcular densidade e correção de pesos ---")
 
-        # 1. Processar a lista de itens a deduzir
+        # 1. Processar a lista de itens a deduzir (apenas os totais entram na
+        # cadeia de cálculo; o detalhe sai das propriedades sob demanda)
         print("-> A processar itens a deduzir...")
-        self.tabela_deducoes, self.total_deducoes = self._processar_lista_de_itens(
-            self.dados_rpi['itens_a_deduzir']
+        _, self.total_deducoes = self._processar_lista_de_itens(
+            self.dados_rpi['itens_a_deduzir'], detailed=False
         )
         print("Itens a deduzir processados.")
 
         # 2. Processar a lista de itens a acrescentar
         print("-> A processar itens a acrescentar...")
-        self.tabela_acrescimos, self.total_acrescimos = self._processar_lista_de_itens(
-            self.dados_rpi['itens_a_acrescentar']
+        _, self.total_acrescimos = self._processar_lista_de_itens(
+            self.dados_rpi['itens_a_acrescentar'], detailed=False
         )
         print("Itens a acrescentar processados.")
 
+        self._pesos_done = True
+
     def processar_leituras_inclinacao(self):
         """
         Processa os dados brutos dos pêndulos ou tubos em U para calcular as médias
@@ -220,121 +568,152 @@ class CalculadoraRPI:
         dados_leituras = self.dados_rpi.get('dados_leituras', {})
         metodo = self.dados_rpi.get('metodo_inclinacao', "")
 
-        # Função auxiliar para converter a string "1;2;3;4;5" numa lista de floats
-        def _parse_lista_leituras(texto: str) -> List[float]:
-            return [float(p.strip()) for p in texto.split(';') if p.strip()]
+        # Função auxiliar para converter a string "1;2;3;4;5" num array de floats.
+        # O parser em C do NumPy (sep=';') tolera espaços em volta dos separadores
+        # e substitui o split + float() token a token em Python.
+        def _parse_lista_leituras(texto: str) -> np.ndarray:
+            if not texto.strip():
+                return np.empty(0, dtype=np.float64)
+            return np.fromstring(texto, sep=';', dtype=np.float64)
+
+        # As séries de um dispositivo são concatenadas num único array plano
+        # (todos os movimentos de uma vez) e cada segmento é somado com
+        # np.add.reduceat: uma redução em C por dispositivo em vez de várias
+        # chamadas np.mean sobre arrays minúsculos.
+        def _somas_por_segmento(partes: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+            tamanhos = np.array([parte.size for parte in partes])
+            offsets = np.concatenate(([0], np.cumsum(tamanhos[:-1])))
+            somas = np.add.reduceat(np.concatenate(partes), offsets)
+            return somas, tamanhos
 
         if "Pêndulos" in metodo:
             lista_pendulos_brutos = dados_leituras.get('pendulos', [])
+            n_mov = max((len(p['leituras']) for p in lista_pendulos_brutos), default=0)
+            leituras = np.zeros((len(lista_pendulos_brutos), n_mov), dtype=_DTYPE_LEITURA_PENDULO)
             for i, pendulo in enumerate(lista_pendulos_brutos):
-                print(f"   A processar Pêndulo nº {i+1}...")
-                dados_processados_pendulo = {"tipo": "Pêndulo", "id": i + 1}
-                medias_movimentos = []
-                for mov_idx, leitura_mov in enumerate(pendulo['leituras']):
-                    maximos = _parse_lista_leituras(leitura_mov['maximos'])
-                    minimos = _parse_lista_leituras(leitura_mov['minimos'])
-                    
-                    media_max = np.mean(maximos)
-                    media_min = np.mean(minimos)
-                    
-                    medias_movimentos.append({
-                        "movimento": mov_idx,
-                        "media_max": media_max,
-                        "media_min": media_min,
-                        "media": (media_max + media_min) / 2
-                    })
-                dados_processados_pendulo["medias_movimentos"] = medias_movimentos
-                self.leituras_processadas.append(dados_processados_pendulo)
-        
+                logger.debug("A processar Pêndulo nº %d...", i + 1)
+                # Dois segmentos (máximos, mínimos) por movimento
+                partes = [
+                    _parse_lista_leituras(leitura_mov[chave])
+                    for leitura_mov in pendulo['leituras']
+                    for chave in ('maximos', 'minimos')
+                ]
+                somas, tamanhos = _somas_por_segmento(partes)
+                medias = (somas / tamanhos).reshape(-1, 2)
+
+                n = medias.shape[0]
+                leituras['media_max'][i, :n] = medias[:, 0]
+                leituras['media_min'][i, :n] = medias[:, 1]
+                leituras['media'][i, :n] = (medias[:, 0] + medias[:, 1]) / 2
+            self.leituras_processadas = leituras
+
         elif "Tubos" in metodo:
             lista_tubos_brutos = dados_leituras.get('tubos', [])
+            n_mov = max((len(t['leituras']) for t in lista_tubos_brutos), default=0)
+            leituras = np.zeros((len(lista_tubos_brutos), n_mov), dtype=_DTYPE_LEITURA_TUBO)
             for i, tubo in enumerate(lista_tubos_brutos):
-                print(f"   A processar Tubo em U nº {i+1}...")
-                dados_processados_tubo = {"tipo": "Tubo em U", "id": i + 1}
-                medias_movimentos = []
-                for mov_idx, leitura_mov in enumerate(tubo['leituras']):
-                    max_bb = _parse_lista_leituras(leitura_mov['maximos_bb'])
-                    min_bb = _parse_lista_leituras(leitura_mov['minimos_bb'])
-                    max_be = _parse_lista_leituras(leitura_mov['maximos_be'])
-                    min_be = _parse_lista_leituras(leitura_mov['minimos_be'])
-
-                    medias_movimentos.append({
-                        "movimento": mov_idx,
-                        "media_max_bb": np.mean(max_bb),
-                        "media_min_bb": np.mean(min_bb),
-                        "media_bb": np.mean(max_bb + min_bb),
-                        "media_max_be": np.mean(max_be),
-                        "media_min_be": np.mean(min_be),
-                        "media_be": np.mean(max_be + min_be),
-                    })
-                dados_processados_tubo["medias_movimentos"] = medias_movimentos
-                self.leituras_processadas.append(dados_processados_tubo)
-        print(f'leituras processadas: {self.leituras_processadas}')
-        
+                logger.debug("A processar Tubo em U nº %d...", i + 1)
+                # Quatro segmentos (máx/mín de BB e BE) por movimento
+                partes = [
+                    _parse_lista_leituras(leitura_mov[chave])
+                    for leitura_mov in tubo['leituras']
+                    for chave in ('maximos_bb', 'minimos_bb', 'maximos_be', 'minimos_be')
+                ]
+                somas, tamanhos = _somas_por_segmento(partes)
+                somas = somas.reshape(-1, 4)
+                tamanhos = tamanhos.reshape(-1, 4)
+                medias = somas / tamanhos
+
+                n = medias.shape[0]
+                leituras['media_max_bb'][i, :n] = medias[:, 0]
+                leituras['media_min_bb'][i, :n] = medias[:, 1]
+                leituras['media_max_be'][i, :n] = medias[:, 2]
+                leituras['media_min_be'][i, :n] = medias[:, 3]
+                # As médias combinadas saem das mesmas somas parciais
+                leituras['media_bb'][i, :n] = (somas[:, 0] + somas[:, 1]) / (tamanhos[:, 0] + tamanhos[:, 1])
+                leituras['media_be'][i, :n] = (somas[:, 2] + somas[:, 3]) / (tamanhos[:, 2] + tamanhos[:, 3])
+            self.leituras_processadas = leituras
+        logger.debug('leituras processadas: %s', self.leituras_processadas)
+
+        # Deixa os comprimentos dos dispositivos prontos para o cálculo do GM.
+        self._cache_comprimentos()
+
         print("-> Leituras processadas com sucesso.")
 
+    def _cache_comprimentos(self):
+        """
+        Constrói os ndarrays com o comprimento/distância vertical e o tipo de
+        cada dispositivo de medição (0 = pêndulo, 1 = tubo em U).
+
+        Evita reconstruir as list comprehensions sobre 'dados_leituras' a cada
+        chamada de calcular_gm_vcg.
+        """
+        metodo = self.dados_rpi.get('metodo_inclinacao', "")
+        if "Pêndulos" in metodo:
+            pendulos_info = self.dados_rpi['dados_leituras']['pendulos']
+            self._comprimentos = np.array(
+                [float(p['comprimento']) for p in pendulos_info], dtype=np.float64
+            )
+            self._tipo_dispositivo = np.zeros(len(pendulos_info), dtype=np.int8)
+        elif "Tubos" in metodo:
+            tubos_info = self.dados_rpi['dados_leituras']['tubos']
+            self._comprimentos = np.array(
+                [float(t['distancia_vertical']) for t in tubos_info], dtype=np.float64
+            )
+            self._tipo_dispositivo = np.ones(len(tubos_info), dtype=np.int8)
+        else:
+            self._comprimentos = np.zeros(0, dtype=np.float64)
+            self._tipo_dispositivo = np.zeros(0, dtype=np.int8)
+
     def calcular_momentos_inclinantes(self):
         """
         Calcula a série de momentos inclinantes transversais para os 8 movimentos
         da prova de inclinação.
         """
         print("\n-> A calcular momentos inclinantes para cada movimento...")
-        
-        # Filtrar apenas os pesos da prova da lista de deduções
-        pesos_prova_brutos = [
-            item for item in self.dados_rpi['itens_a_deduzir']
-            if 'Peso da prova' in item['nome']
-        ]
 
         # Se não houver pesos sólidos (ex: prova com lastro), não há nada a fazer.
-        if not pesos_prova_brutos:
+        # O filtro 'Peso da prova' já foi pré-compilado no __init__.
+        if self._pesos_prova_peso.size == 0:
             print("   Prova com pesos líquidos. A saltar cálculo de momentos de pesos sólidos.")
             self.momentos_inclinantes = [0.0] * 9 # Retorna uma lista de zeros
             return
 
-        # Converter os dados para tipos numéricos
-        pesos_prova = []
-        for p in pesos_prova_brutos:
-            pesos_prova.append({
-                'nome': p['nome'],
-                'peso': float(p['peso']),
-                'tcg': float(p['tcg'])
-            })
-
         # --- Início da Simulação ---
-        # A sequência de movimentos pressupõe uma ordem específica dos pesos.
-        # Vamos assumir que foram inseridos na ordem A, B, C, D.
-        # Nomenclatura para clareza: A=0, B=1, C=2, D=3
-        
-        # Usamos deepcopy para não modificar o estado original dos pesos
-        estado_atual_pesos = copy.deepcopy(pesos_prova)
-        momentos_calculados = []
-
-        # Função auxiliar para calcular o momento total num dado estado
-        def _get_momento_total(estado_dos_pesos):
-            momento_total = 0
-            for p in estado_dos_pesos:
-                momento_total += p['peso'] * p['tcg']
-            return momento_total
-
-        # Movimento 0: Estado Inicial
-        momento_inicial = _get_momento_total(estado_atual_pesos)
-        momentos_calculados.append(momento_inicial)
-        print(f"   Movimento 0 (Inicial): Momento Total = {momento_inicial:.4f} t.m")
-
-        # Sequência de movimentos [ (índice_do_peso, 'direção'), ... ]
-        # A sua sequência é: B, C, C(volta), B(volta), A, D, A(volta), D(volta)
-        sequencia_movimentos = [1, 2, 2, 1, 0, 3, 0, 3]
-
-        for i, idx_peso in enumerate(sequencia_movimentos):
-            # Inverte o sinal do TCG do peso a ser movido
-            estado_atual_pesos[idx_peso]['tcg'] *= -1
-            
-            momento_movimento = _get_momento_total(estado_atual_pesos)
-            momentos_calculados.append(momento_movimento)
-            print(f"   Movimento {i+1} ({estado_atual_pesos[idx_peso]['nome']}): Momento Total = {momento_movimento:.4f} t.m")
-            
-        self.momentos_inclinantes = momentos_calculados
+        # A sequência de movimentos pressupõe uma ordem específica dos pesos
+        # (inseridos na ordem A, B, C, D) e está em _SEQUENCIA_MOVIMENTOS.
+        # A tabela de sinais acumulados correspondente é pré-computada em
+        # tempo de import para a prova padrão de 4 pesos; para outra
+        # quantidade, é reconstruída sob demanda.
+        pesos = self._pesos_prova_peso
+        tcgs0 = self._pesos_prova_tcg
+
+        if pesos.size == _SINAIS_MOVIMENTOS.shape[1]:
+            sinais = _SINAIS_MOVIMENTOS
+        else:
+            sinais = _montar_tabela_sinais(_SEQUENCIA_MOVIMENTOS, pesos.size)
+
+        # Atualização incremental: cada movimento inverte o TCG de um único
+        # peso, alterando o momento em -2 * peso * tcg (com o sinal acumulado
+        # antes da inversão). O momento inicial é um produto escalar e os
+        # seguintes saem de uma soma cumulativa dos deltas — O(1) por
+        # movimento em vez de refazer a soma de todos os pesos.
+        contribuicoes = pesos * tcgs0
+        seq = np.asarray(_SEQUENCIA_MOVIMENTOS)
+        sinais_antes = sinais[np.arange(seq.size), seq]
+        deltas = -2.0 * sinais_antes * contribuicoes[seq]
+
+        momentos = np.empty(seq.size + 1, dtype=np.float64)
+        momentos[0] = contribuicoes.sum()
+        momentos[1:] = momentos[0] + np.cumsum(deltas)
+        self.momentos_inclinantes = momentos.tolist()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Movimento 0 (Inicial): Momento Total = %.4f t.m", momentos[0])
+            for i, idx_peso in enumerate(_SEQUENCIA_MOVIMENTOS):
+                logger.debug("Movimento %d (%s): Momento Total = %.4f t.m",
+                             i + 1, self._pesos_prova_nomes[idx_peso], momentos[i + 1])
+
         print("-> Cálculo de momentos inclinantes concluído.")
 
     def calcular_caracteristicas_hidrostaticas_prova(self):
@@ -346,29 +725,28 @@ class CalculadoraRPI:
         print("\n-> A calcular características hidrostáticas da prova...")
         
         # Certificar que o cálculo prévio foi executado
-        if not self.calados_nas_perpendiculares or not self.calados_nas_marcas:
+        if self.calados_nas_perpendiculares is None or not self.calados_nas_marcas:
             print("ERRO: É necessário primeiro calcular a condição de flutuação.")
             return
 
-        HPR = self.calados_nas_perpendiculares["re"]
-        HPV = self.calados_nas_perpendiculares["vante"]
-        HMN = self.calados_nas_perpendiculares["meio"]
+        HPR = self.calados_nas_perpendiculares.re
+        HPV = self.calados_nas_perpendiculares.vante
+        HMN = self.calados_nas_perpendiculares.meio
         
         HMR = self.calados_nas_marcas["re"]
         HMV = self.calados_nas_marcas["vante"]
 
-        # 1. Calcular o Calado Médio (TM)
-        self.calado_medio = (HPR + HPV) / 2
+        # Calado médio, deflexão e trim saem de um único produto matriz-vetor
+        # sobre os cinco calados (ver _MATRIZ_CARACTERISTICAS).
+        calados = np.array([HPR, HPV, HMN, HMR, HMV])
+        self.calado_medio, self.deflexao, self.trim = (_MATRIZ_CARACTERISTICAS @ calados).tolist()
+
         print(f"   Calado Médio (nas PP) calculado: {self.calado_medio:.4f} m")
 
-        # 2. Calcular a Deflexão (Hogging/Sagging)
-        self.deflexao = HMN - self.calado_medio
-        deflexao_tipo = "Hogging (Alquebramento)" if self.deflexao < 0 else "Sagging (Contra-alquebramento)"
+        deflexao_tipo = _ROTULOS_DEFLEXAO[int(np.sign(self.deflexao)) + 1]
         print(f"   Deflexão calculada: {abs(self.deflexao):.4f} m ({deflexao_tipo})")
 
-        # 3. Calcular o Trim (t)
-        self.trim = HMR - HMV
-        trim_direcao = "Trim pela Popa" if self.trim > 0 else "Trim pela Proa" if self.trim < 0 else "Sem Trim"
+        trim_direcao = _ROTULOS_TRIM[int(np.sign(self.trim)) + 1]
         print(f"   Trim (nas marcas) calculado: {abs(self.trim):.4f} m ({trim_direcao})")
 
 
@@ -387,31 +765,34 @@ class CalculadoraRPI:
             InterpoladorCasco: Um novo objeto com a geometria do casco corrigida
                                para a deflexão.
         """
-        print("\n-> A aplicar correção de deflexão à tabela de cotas...")
-        
         if self.deflexao is None or self.casco is None:
             print("ERRO: A deflexão e a geometria do casco devem ser calculadas primeiro.")
             return None
 
         deflexao_maxima = self.deflexao
         lpp = float(self.dados_hidrostaticos['lpp'])
-        
-        # Copia a tabela de cotas original para não modificar os dados base
-        tabela_corrigida = self.casco.tabela_cotas.copy()
-        
-        # 1. Função da parábola de deflexão
-        # d(x) = 4 * deflexao_maxima * (Lpp*x - x^2) / Lpp^2
-        def calcular_delta_z(x):
-            if lpp == 0: return 0
-            return (4 * deflexao_maxima * (lpp * x - x**2)) / (lpp**2)
-
-        # 2. Aplicar a correção a todos os pontos 'z' da tabela
-        # A função .apply do pandas é eficiente para esta operação
-        tabela_corrigida['z'] = tabela_corrigida.apply(
-            lambda row: row['z'] + calcular_delta_z(row['x']),
-            axis=1
-        )
-        
+
+        # Memoização: se a deflexão e o Lpp não mudaram desde a última
+        # chamada, a correção e o novo interpolador seriam idênticos —
+        # devolve o casco corrigido já construído.
+        chave = (deflexao_maxima, lpp)
+        if self._casco_corrigido_chave == chave and self._casco_corrigido_cache is not None:
+            return self._casco_corrigido_cache
+
+        print("\n-> A aplicar correção de deflexão à tabela de cotas...")
+
+        # 1. Parábola de deflexão vetorizada, partilhada com PropriedadesDeflexao
+        # (ver _deflexao_delta_z em ch.py), aplicada sobre as colunas SoA da
+        # tabela de cotas extraídas no __init__.
+        if lpp == 0:
+            novo_z = self._cotas_z
+        else:
+            novo_z = self._cotas_z + _deflexao_delta_z(self._cotas_x, deflexao_maxima, lpp)
+
+        # 2. O DataFrame só é materializado aqui, para alimentar o novo
+        # interpolador; as colunas 'x' e 'y' reutilizam os arrays existentes.
+        tabela_corrigida = pd.DataFrame({'x': self._cotas_x, 'y': self._cotas_y, 'z': novo_z})
+
         print("   Correção de deflexão aplicada com sucesso.")
         
         # Cria e retorna um novo interpolador com a geometria corrigida
@@ -419,6 +800,8 @@ class CalculadoraRPI:
             tabela_corrigida,
             metodo_interp=self.casco.metodo_interp
         )
+        self._casco_corrigido_cache = casco_corrigido
+        self._casco_corrigido_chave = chave
         return casco_corrigido
 
     def calcular_hidrostaticos_corrigidos(self):
@@ -451,8 +834,8 @@ class CalculadoraRPI:
         #    Usamos os calados corrigidos (já calculados em um passo anterior)
         #    para instanciar a classe PropriedadesTrim.
         prop_trim = PropriedadesTrim(
-            calado_re=self.calados_nas_perpendiculares['re'],
-            calado_vante=self.calados_nas_perpendiculares['vante'],
+            calado_re=self.calados_nas_perpendiculares.re,
+            calado_vante=self.calados_nas_perpendiculares.vante,
             lpp=self.dados_hidrostaticos['lpp'],
             posicoes_balizas=casco_corrigido.posicoes_balizas
         )
@@ -469,18 +852,18 @@ class CalculadoraRPI:
         
         # 2. Extrair e armazenar todos os resultados necessários
         props = self.propriedades_hidrostaticas_corrigidas
-        self.hidrostaticos_prova = {
-            "Deslocamento": props.deslocamento,
-            "Volume": props.volume,
-            "LCB": props.lcb,
-            "VCB": props.vcb,
-            "KMt": props.kmt,
-            "MTc": props.mtc,
-            "LCG": props.lcb - (100 * props.mtc * prop_trim.trim) / props.deslocamento
-        }
+        self.hidrostaticos_prova = HidrostaticosProva(
+            deslocamento=props.deslocamento,
+            volume=props.volume,
+            lcb=props.lcb,
+            vcb=props.vcb,
+            kmt=props.kmt,
+            mtc=props.mtc,
+            lcg=props.lcb - (100 * props.mtc * prop_trim.trim) / props.deslocamento
+        )
 
         print("   Propriedades na condição da prova obtidas com sucesso:")
-        for chave, valor in self.hidrostaticos_prova.items():
+        for chave, valor in self.hidrostaticos_prova.as_dict().items():
             print(f"     - {chave}: {valor:.4f}")
 
     def calcular_gm_vcg(self):
@@ -492,75 +875,68 @@ class CalculadoraRPI:
         print("\n--- A calcular GM e VCG a partir dos dados da prova ---")
 
         # 1. Validar se os dados necessários estão disponíveis
-        if not self.leituras_processadas:
+        if self.leituras_processadas is None or len(self.leituras_processadas) == 0:
             print("ERRO: As leituras da inclinação não foram processadas.")
             return
         if not self.momentos_inclinantes or len(self.momentos_inclinantes) < 9:
             print("ERRO: Os momentos inclinantes não foram calculados.")
             return
-        if not self.hidrostaticos_prova or "Deslocamento" not in self.hidrostaticos_prova:
+        if self.hidrostaticos_prova is None:
             print("ERRO: O deslocamento corrigido não foi calculado.")
             return
 
-        deslocamento = self.hidrostaticos_prova["Deslocamento"]
+        deslocamento = self.hidrostaticos_prova.deslocamento
         momento_inicial = self.momentos_inclinantes[0]
         
-        # Estrutura para obter o comprimento/distância de cada dispositivo
-        comprimentos_dispositivos = []
-        metodo = self.dados_rpi.get('metodo_inclinacao', "")
-        if "Pêndulos" in metodo:
-            pendulos_info = self.dados_rpi['dados_leituras']['pendulos']
-            comprimentos_dispositivos = [p['comprimento'] for p in pendulos_info]
-        elif "Tubos" in metodo:
-            tubos_info = self.dados_rpi['dados_leituras']['tubos']
-            comprimentos_dispositivos = [t['distancia_vertical'] for t in tubos_info]
+        # Comprimento/distância de cada dispositivo, em cache como ndarray.
+        # O cache é construído por processar_leituras_inclinacao; se as leituras
+        # foram injetadas diretamente, é construído aqui sob demanda.
+        if self._comprimentos is None:
+            self._cache_comprimentos()
+        comprimentos_dispositivos = self._comprimentos
 
         lista_gm_movimentos = []
 
+        leituras = self.leituras_processadas
+        # Todos os dispositivos de uma prova partilham o método de inclinação;
+        # o dtype do array estruturado identifica o tipo.
+        eh_tubo = 'media_bb' in (leituras.dtype.names or ())
+
+        # Dispositivos válidos (comprimento não nulo), fixos para todos os
+        # movimentos: o filtro sai do loop.
+        validos = comprimentos_dispositivos != 0
+
         # Itera sobre os 8 movimentos (índices 1 a 8)
         for mov_idx in range(1, 9):
             # Ignorar movimentos 4 e 8 conforme a sua lógica (índices 3 e 7)
             if mov_idx in [4, 8]:
                 continue
-                
-            tangentes_do_movimento = []
-
-            # Para cada movimento, calcula a tangente em cada dispositivo
-            for disp_idx, dispositivo in enumerate(self.leituras_processadas):
-                leituras_mov = dispositivo["medias_movimentos"]
-                leitura_inicial = leituras_mov[0]
-                leitura_atual = leituras_mov[mov_idx]
-                
-                comprimento_L = comprimentos_dispositivos[disp_idx]
-                if comprimento_L == 0: continue # Evita divisão por zero
-
-                deflexao = 0.0
-                # Passo 1: Calcular a deflexão
-                if dispositivo['tipo'] == 'Pêndulo':
-                    deflexao = leitura_atual['media'] - leitura_inicial['media']
-                
-                elif dispositivo['tipo'] == 'Tubo em U':
-                    # deflexão = (L1 - L2) + (L4 - L3)
-                    l1 = leitura_inicial['media_bb']
-                    l2 = leitura_atual['media_bb']
-                    l3 = leitura_inicial['media_be']
-                    l4 = leitura_atual['media_be']
-                    deflexao = (l1 - l2) + (l4 - l3)
-
-                # Passo 2: Calcular a tangente de theta
-                tan_theta = deflexao / comprimento_L
-                tangentes_do_movimento.append(tan_theta)
-
-            # Passo 3: Calcular a tangente média do movimento
-            if not tangentes_do_movimento: continue
-            tan_media_movimento = np.mean(tangentes_do_movimento)
-            
+
+            # Passo 1: deflexão de todos os dispositivos, por indexação
+            # estruturada (um campo = uma coluna float64 contígua)
+            if eh_tubo:
+                # deflexão = (L1 - L2) + (L4 - L3)
+                deflexoes = ((leituras['media_bb'][:, 0] - leituras['media_bb'][:, mov_idx])
+                             + (leituras['media_be'][:, mov_idx] - leituras['media_be'][:, 0]))
+            else:
+                deflexoes = leituras['media'][:, mov_idx] - leituras['media'][:, 0]
+
+            # Passos 2 e 3: tangentes e tangente média do movimento
+            if not validos.any():
+                continue
+            tangentes = deflexoes[validos] / comprimentos_dispositivos[validos]
+            tan_media_movimento = tangentes.mean()
+
             # Passo 4: Calcular a altura metacêntrica (GM) do movimento
             # O momento inclinante é a *diferença* em relação ao estado inicial
             momento_inclinante = self.momentos_inclinantes[mov_idx] - momento_inicial
-            
-            # Evita divisão por zero se a tangente for nula
-            if abs(tan_media_movimento * deslocamento) < 1e-9:
+
+            # Evita divisão por zero se a tangente ou o deslocamento forem nulos.
+            # O caso exato em zero é resolvido sem calcular o produto; o guarda
+            # com abs() fica apenas para o caminho não trivial.
+            if tan_media_movimento == 0.0 or deslocamento == 0.0:
+                gm_movimento = 0.0
+            elif abs(tan_media_movimento * deslocamento) < 1e-9:
                 gm_movimento = 0.0
             else:
                 gm_movimento = abs(momento_inclinante / (tan_media_movimento * deslocamento))
@@ -574,8 +950,8 @@ class CalculadoraRPI:
                 "Tangente Média": tan_media_movimento,
                 "GM Calculado (m)": gm_movimento
             })
-            print(f"   Movimento {mov_idx}: Mom. Inclinante={momento_inclinante:+.2f} t.m, "
-                  f"Tan(θ)={tan_media_movimento:.5f}, GM={gm_movimento:.4f} m")
+            logger.debug("Movimento %d: Mom. Inclinante=%+.2f t.m, Tan(θ)=%.5f, GM=%.4f m",
+                         mov_idx, momento_inclinante, tan_media_movimento, gm_movimento)
 
         # Calcular o GM final como a média dos GMs válidos
         if not lista_gm_movimentos:
@@ -586,7 +962,7 @@ class CalculadoraRPI:
         print(f"\n-> Altura Metacêntrica (GM) média calculada: {self.gm_prova:.4f} m")
 
         # Calcular o VCG/KG final
-        kmt_prova = self.hidrostaticos_prova.get("KMt", 0.0)
+        kmt_prova = self.hidrostaticos_prova.kmt
         self.vcg_prova = kmt_prova - self.gm_prova
         print(f"   KMt na condição da prova: {kmt_prova:.4f} m")
         print(f"-> VCG (KG) na condição 'como inclinado': {self.vcg_prova:.4f} m")
@@ -602,13 +978,13 @@ class CalculadoraRPI:
         print("\n--- A calcular a condição final de Navio Leve ---")
 
         # 1. Validar se os dados de partida estão disponíveis
-        if not self.hidrostaticos_prova or not self.vcg_prova:
+        if self.hidrostaticos_prova is None or not self.vcg_prova:
             print("ERRO: A condição 'como inclinado' não foi calculada. Execute os passos anteriores.")
             return
 
         # 2. Obter os dados da condição "como inclinado"
-        desloc_prova = self.hidrostaticos_prova['Deslocamento']
-        lcg_prova = self.hidrostaticos_prova['LCG']
+        desloc_prova = self.hidrostaticos_prova.deslocamento
+        lcg_prova = self.hidrostaticos_prova.lcg
         vcg_prova = self.vcg_prova
 
         # Calcular os momentos iniciais
@@ -647,105 +1023,264 @@ class CalculadoraRPI:
             vcg_leve = momento_vert_leve / desloc_leve
 
         # 6. Armazenar os resultados
-        self.navio_leve_resultados = {
-            'Deslocamento Leve (t)': desloc_leve,
-            'Momento Long. Leve (t.m)': momento_long_leve,
-            'Momento Vert. Leve (t.m)': momento_vert_leve,
-            'LCG Leve (m)': lcg_leve,
-            'VCG Leve (m)': vcg_leve
-        }
+        self.navio_leve_resultados = NavioLeveResultados(
+            deslocamento=desloc_leve,
+            momento_long=momento_long_leve,
+            momento_vert=momento_vert_leve,
+            lcg=lcg_leve,
+            vcg=vcg_leve
+        )
 
         print("\n-> Resultados Finais para Navio Leve:")
-        for chave, valor in self.navio_leve_resultados.items():
+        for chave, valor in self.navio_leve_resultados.as_dict().items():
             print(f"   - {chave}: {valor:.4f}")
 
-    def calcular_hidrostaticos_navio_leve(self):
+    def _build_hidro_grid(self, cal_min: float, cal_max: float, n_cal: int = 64,
+                          trim_min: float = -0.5, trim_max: float = 0.5, n_trim: int = 9):
+        """
+        Pré-calcula uma grade densa de propriedades hidrostáticas
+        (calado médio x trim) como arrays float64 contíguos.
+
+        Cada ponto da grade é avaliado uma única vez com o caminho exato
+        (PropriedadesTrim + PropriedadesHidrostaticas); depois disso o solver
+        iterativo pode consultar a grade por interpolação bilinear em vez de
+        reconstruir os objetos a cada tentativa. Útil quando o mesmo casco é
+        resolvido várias vezes (ex: provas em lote).
+        """
+        lpp = self.dados_hidrostaticos['lpp']
+        calados = np.linspace(cal_min, cal_max, n_cal)
+        trims = np.linspace(trim_min, trim_max, n_trim)
+
+        # Ordem fixa das propriedades no eixo 0: desloc, lcb, mtc, lcf, tpc, kmt
+        valores = np.empty((6, n_cal, n_trim), dtype=np.float64)
+        for i, calado in enumerate(calados):
+            for j, trim in enumerate(trims):
+                prop_trim = PropriedadesTrim(
+                    calado_re=calado - trim / 2,
+                    calado_vante=calado + trim / 2,
+                    lpp=lpp,
+                    posicoes_balizas=self.casco.posicoes_balizas
+                )
+                props = PropriedadesHidrostaticas(
+                    interpolador_casco=self.casco,
+                    densidade=self.densidade_media,
+                    prop_trim=prop_trim
+                )
+                valores[:, i, j] = (props.deslocamento, props.lcb, props.mtc,
+                                    props.lcf, props.tpc, props.kmt)
+
+        self._hg = {'cal': calados, 'trim': trims, 'valores': valores}
+
+    def _lookup_hidro(self, calado_medio: float, trim: float) -> Tuple[float, ...]:
+        """
+        Interpola bilinearmente a grade hidrostática pré-calculada.
+
+        Delega no kernel numérico puro `interp_bilinear` de `_rpi_kernels`.
+
+        Returns:
+            Tuple[float, ...]: (deslocamento, lcb, mtc, lcf, tpc, kmt) no
+            ponto (calado_medio, trim).
+        """
+        return tuple(interp_bilinear(
+            self._hg['cal'], self._hg['trim'], self._hg['valores'],
+            calado_medio, trim
+        ))
+
+    def resolver_flutuacao_em_lote(self, deslocamentos_alvo, lcgs_alvo) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve a condição de flutuação de vários cenários de uma só vez.
+
+        Cada cenário é um par (deslocamento alvo [t], LCG alvo [m]) — por
+        exemplo, variações da condição de navio leve em estudos de
+        sensibilidade. A grade hidrostática é construída uma única vez e
+        amortizada por todos os cenários; os passos de Newton avançam em
+        lote, vetorizados sobre arrays float64 (kernel `batch_converge_leve`).
+
+        Args:
+            deslocamentos_alvo: Sequência com os deslocamentos alvo [t].
+            lcgs_alvo: Sequência com os LCGs alvo correspondentes [m].
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Calados de ré e de vante
+            convergidos, um par por cenário.
+        """
+        deslocamentos = np.asarray(deslocamentos_alvo, dtype=np.float64)
+        lcgs = np.asarray(lcgs_alvo, dtype=np.float64)
+
+        if self._hg is None:
+            self._build_hidro_grid(
+                cal_min=max(0.05, self.calado_medio - 0.5),
+                cal_max=self.calado_medio + 0.5
+            )
+
+        # Estimativa inicial comum: calado médio da prova, sem trim.
+        calados_iniciais = np.full(deslocamentos.shape, self.calado_medio)
+
+        return batch_converge_leve(
+            calados_iniciais, calados_iniciais,
+            deslocamentos, lcgs,
+            self.dados_hidrostaticos['lpp'],
+            self._hg['cal'], self._hg['trim'], self._hg['valores']
+        )
+
+    def calcular_hidrostaticos_navio_leve(self, usar_grade_hidro: bool = False):
         """
         Calcula a condição de flutuação (trim e calado) e as características
         hidrostáticas para a condição de navio leve através de um processo iterativo.
+
+        Args:
+            usar_grade_hidro (bool): Se True, as iterações do solver consultam
+                a grade hidrostática pré-calculada (interpolação bilinear) em
+                vez de reavaliar o casco; a verificação final do resíduo é
+                sempre feita com a avaliação exata. O padrão (False) avalia o
+                casco diretamente, o que é mais barato para uma única prova.
         """
         print("\n--- A calcular hidrostáticas para a condição de Navio Leve (processo iterativo) ---")
 
         # 1. Obter os alvos: Deslocamento e LCG do navio leve
-        if not self.navio_leve_resultados:
+        if self.navio_leve_resultados is None:
             print("ERRO: A condição de navio leve deve ser calculada primeiro.")
             return
-        
-        desloc_alvo = self.navio_leve_resultados['Deslocamento Leve (t)']
-        lcg_alvo = self.navio_leve_resultados['LCG Leve (m)']
+
+        desloc_alvo = self.navio_leve_resultados.deslocamento
+        lcg_alvo = self.navio_leve_resultados.lcg
         lpp = self.dados_hidrostaticos['lpp']
 
-        # 2. Iniciar o processo iterativo
+        # 2. Iniciar o processo iterativo (Newton 2-D com Jacobiano analítico)
         # Começamos com uma estimativa inicial: o calado médio da prova, sem trim.
         calado_re_atual = self.calado_medio
         calado_vante_atual = self.calado_medio
-        
-        max_iteracoes = 100
+
+        # O Jacobiano diagonal (termos cruzados nulos) torna o corretor
+        # equivalente ao TPC/MTC desacoplado: a convergência é linear, não
+        # quadrática. O resíduo é portanto verificado a cada iteração — duas
+        # comparações escalares, desprezíveis frente à avaliação hidrostática
+        # — e o laço sai assim que a tolerância é atingida; o teto alto é
+        # apenas uma salvaguarda contra casos patológicos.
+        max_iteracoes = 30
         tolerancia = 1e-4 # Tolerância para convergência (0.01%)
 
+        if usar_grade_hidro and self._hg is None:
+            # Grade centrada no calado médio da prova, com folga para a
+            # correção de deslocamento e de trim do navio leve.
+            self._build_hidro_grid(
+                cal_min=max(0.05, self.calado_medio - 0.5),
+                cal_max=self.calado_medio + 0.5
+            )
+
+        # Traço das iterações: guardado sempre (barato), impresso só em modo
+        # verboso — formatação + flush do stdout custam mais do que o passo.
+        self._trace_navio_leve: List[Tuple[float, float, float, float]] = []
+
+        # Os objetos de trim/hidrostáticas são construídos uma única vez e
+        # reposicionados com update() nas iterações seguintes.
+        prop_trim_iter = None
+        props_iter = None
+        iteracao_convergida = None
+
         for i in range(max_iteracoes):
-            print(f"\nIteração {i+1}:")
-            print(f"   - Tentativa: Calado Ré={calado_re_atual:.4f}m, Calado Vante={calado_vante_atual:.4f}m")
+            if self.verbose:
+                print(f"\nIteração {i+1}:")
+                print(f"   - Tentativa: Calado Ré={calado_re_atual:.4f}m, Calado Vante={calado_vante_atual:.4f}m")
 
             # 3. Calcular as hidrostáticas para a tentativa atual
-            prop_trim_iter = PropriedadesTrim(
+            if usar_grade_hidro:
+                # Consulta bilinear na grade pré-calculada (sem reconstruir
+                # PropriedadesTrim/PropriedadesHidrostaticas)
+                desloc_calc, lcb_calc, mtc_calc, lcf_calc, tpc_calc, _ = self._lookup_hidro(
+                    (calado_re_atual + calado_vante_atual) / 2,
+                    calado_vante_atual - calado_re_atual
+                )
+            else:
+                if prop_trim_iter is None:
+                    prop_trim_iter = PropriedadesTrim(
+                        calado_re=calado_re_atual,
+                        calado_vante=calado_vante_atual,
+                        lpp=lpp,
+                        posicoes_balizas=self.casco.posicoes_balizas
+                    )
+                    props_iter = PropriedadesHidrostaticas(
+                        interpolador_casco=self.casco, # Usamos o casco original (sem deflexão da prova)
+                        densidade=self.densidade_media,
+                        prop_trim=prop_trim_iter
+                    )
+                else:
+                    # Reutiliza os objetos: recalcula no lugar para os novos
+                    # calados, só com as propriedades que o passo consome
+                    prop_trim_iter.update(calado_re_atual, calado_vante_atual)
+                    props_iter.update(prop_trim=prop_trim_iter, somente_essenciais=True)
+
+                desloc_calc = props_iter.deslocamento
+                lcb_calc = props_iter.lcb
+                mtc_calc = props_iter.mtc
+                lcf_calc = props_iter.lcf
+                tpc_calc = props_iter.tpc
+
+            self._trace_navio_leve.append(
+                (calado_re_atual, calado_vante_atual, desloc_calc, lcb_calc)
+            )
+            if self.verbose:
+                print(f"   - Resultados: Desloc={desloc_calc:.3f}t, LCB={lcb_calc:.3f}m")
+
+            # 4. Verificação de convergência da tentativa atual
+            erro_desloc = (desloc_calc - desloc_alvo) / desloc_alvo if desloc_alvo else 0
+            erro_lcg = (lcb_calc - lcg_alvo) / lpp if lpp else 0
+            if abs(erro_desloc) < tolerancia and abs(erro_lcg) < tolerancia:
+                iteracao_convergida = i + 1
+                break
+
+            # 5. Passo de Newton: resolve J * delta = -F em forma fechada.
+            # O corretor é um kernel numérico puro (só escalares, sem I/O).
+            calado_re_atual, calado_vante_atual = passo_newton_leve(
+                calado_re_atual, calado_vante_atual,
+                desloc_alvo, lcg_alvo, lpp,
+                desloc_calc, lcb_calc, mtc_calc, lcf_calc, tpc_calc
+            )
+
+        # 6. Avaliação final (sempre exata) e verificação do resíduo — em
+        # modo grade, o laço converge sobre valores interpolados, então a
+        # confirmação com a avaliação exata continua necessária.
+        if prop_trim_iter is not None:
+            # Reaproveita os objetos das iterações
+            prop_trim_iter.update(calado_re_atual, calado_vante_atual)
+            props_iter.update(prop_trim=prop_trim_iter)
+            props_final = props_iter
+        else:
+            prop_trim_final = PropriedadesTrim(
                 calado_re=calado_re_atual,
                 calado_vante=calado_vante_atual,
                 lpp=lpp,
                 posicoes_balizas=self.casco.posicoes_balizas
             )
-            props_iter = PropriedadesHidrostaticas(
-                interpolador_casco=self.casco, # Usamos o casco original (sem deflexão da prova)
+            props_final = PropriedadesHidrostaticas(
+                interpolador_casco=self.casco,
                 densidade=self.densidade_media,
-                prop_trim=prop_trim_iter
+                prop_trim=prop_trim_final
             )
-            
-            desloc_calc = props_iter.deslocamento
-            lcb_calc = props_iter.lcb
-            mtc_calc = props_iter.mtc
-            lcf_calc = props_iter.lcf
-            
-            # 4. Verificar a convergência
-            erro_desloc = (desloc_calc - desloc_alvo) / desloc_alvo if desloc_alvo else 0
-            erro_lcg = (lcb_calc - lcg_alvo) / lpp if lpp else 0
 
-            print(f"   - Resultados: Desloc={desloc_calc:.3f}t (erro {erro_desloc:+.4%}), "
-                  f"LCB={lcb_calc:.3f}m (erro LCG {erro_lcg:+.4%})")
+        erro_desloc = (props_final.deslocamento - desloc_alvo) / desloc_alvo if desloc_alvo else 0
+        erro_lcg = (props_final.lcb - lcg_alvo) / lpp if lpp else 0
 
-            if abs(erro_desloc) < tolerancia and abs(erro_lcg) < tolerancia:
-                print(f"\n-> Convergência alcançada!, iteração {i}")
-                # Armazena os resultados finais
-                self.flutuacao_navio_leve = {
-                    'Calado na PP de Ré (m)': calado_re_atual,
-                    'Calado na PP de Vante (m)': calado_vante_atual,
-                    'Calado Médio (m)': (calado_re_atual + calado_vante_atual) / 2,
-                    'Trim (m)': calado_vante_atual - calado_re_atual
-                }
-                self.hidrostaticos_navio_leve = {
-                    'Deslocamento (t)': props_iter.deslocamento,
-                    'LCB (m)': props_iter.lcb,
-                    'MTC (t.m/cm)': props_iter.mtc,
-                    'LCF (m)': props_iter.lcf,
-                    'KMt (m)': props_iter.kmt
-                }
-                return # Termina o método com sucesso
-
-            # 5. Se não convergiu, ajustar os calados para a próxima iteração
-            # Correção do Trim para acertar o LCG:
-            momento_trimante = desloc_alvo * (lcg_alvo - lcb_calc)
-            trim_necessario = momento_trimante / (mtc_calc * 100) if mtc_calc else 0
-            
-            # Distribui o trim em relação ao LCF para encontrar os novos calados de ré e vante
-            calado_re_sem_desloc_corr = calado_re_atual - trim_necessario * (lcf_calc / lpp)
-            calado_vante_sem_desloc_corr = calado_vante_atual + trim_necessario * (1 - (lcf_calc / lpp))
-            
-            # Correção do Calado Médio para acertar o Deslocamento:
-            # Re-calcula as props na nova condição de trim para obter um TPC mais preciso
-            tpc_iter = props_iter.tpc
-            correcao_calado_medio = (desloc_alvo - desloc_calc) / (tpc_iter * 100) if tpc_iter else 0
-            
-            calado_re_atual = calado_re_sem_desloc_corr + correcao_calado_medio
-            calado_vante_atual = calado_vante_sem_desloc_corr + correcao_calado_medio
+        print(f"\n-> Resíduo final: Desloc={props_final.deslocamento:.3f}t (erro {erro_desloc:+.4%}), "
+              f"LCB={props_final.lcb:.3f}m (erro LCG {erro_lcg:+.4%})")
+
+        if abs(erro_desloc) < tolerancia and abs(erro_lcg) < tolerancia:
+            print(f"\n-> Convergência alcançada!, iteração {iteracao_convergida or max_iteracoes}")
+            # Armazena os resultados finais
+            self.flutuacao_navio_leve = FlutuacaoNavioLeve(
+                calado_re=calado_re_atual,
+                calado_vante=calado_vante_atual,
+                calado_medio=(calado_re_atual + calado_vante_atual) / 2,
+                trim=calado_vante_atual - calado_re_atual
+            )
+            self.hidrostaticos_navio_leve = {
+                'Deslocamento (t)': props_final.deslocamento,
+                'LCB (m)': props_final.lcb,
+                'MTC (t.m/cm)': props_final.mtc,
+                'LCF (m)': props_final.lcf,
+                'KMt (m)': props_final.kmt
+            }
+            return # Termina o método com sucesso
 
         print("AVISO: O cálculo de hidrostáticas para navio leve não convergiu após o número máximo de iterações.")
 
@@ -808,10 +1343,13 @@ if __name__ == '__main__':
     leituras_re_be = [1.195, 1.223, 1.245, 1.223, 0, 1.195, 1.165, 1.195, 0]
     leituras_vante_bb = [1.665, 1.645, 1.635, 1.645, 0, 1.685, 1.705, 1.685, 0]
     leituras_vante_be = [1.545, 1.565, 1.585, 1.565, 0, 1.535, 1.51, 1.5355, 0]
-    calculadora.leituras_processadas = [
-        {"tipo": "Tubo em U", "id": 1, "medias_movimentos": [{"movimento": i, "media_bb": leituras_re_bb[i], "media_be": leituras_re_be[i]} for i in range(9)]},
-        {"tipo": "Tubo em U", "id": 2, "medias_movimentos": [{"movimento": i, "media_bb": leituras_vante_bb[i], "media_be": leituras_vante_be[i]} for i in range(9)]}
-    ]
+    from src.core.rpi import _DTYPE_LEITURA_TUBO
+    leituras_teste = np.zeros((2, 9), dtype=_DTYPE_LEITURA_TUBO)
+    leituras_teste['media_bb'][0] = leituras_re_bb
+    leituras_teste['media_be'][0] = leituras_re_be
+    leituras_teste['media_bb'][1] = leituras_vante_bb
+    leituras_teste['media_be'][1] = leituras_vante_be
+    calculadora.leituras_processadas = leituras_teste
     
     calculadora.calcular_gm_vcg()
 
@@ -827,8 +1365,8 @@ if __name__ == '__main__':
 
     # Imprime os resultados finais
     print("\n--- RESULTADOS FINAIS HIDROSTÁTICOS (NAVIO LEVE) ---")
-    if calculadora.flutuacao_navio_leve:
-        for chave, valor in calculadora.flutuacao_navio_leve.items():
+    if calculadora.flutuacao_navio_leve is not None:
+        for chave, valor in calculadora.flutuacao_navio_leve.as_dict().items():
             print(f"   - {chave}: {valor:.4f}")
         for chave, valor in calculadora.hidrostaticos_navio_leve.items():
             print(f"   - {chave}: {valor:.4f}")
@@ -1,13 +1,21 @@
+import math
 import pandas as pd
 import numpy as np
 from scipy.interpolate import interp1d, PchipInterpolator
-from scipy.optimize import fsolve
+from scipy.optimize import brentq
 # from src.utils.integration import integrar
-from scipy.integrate import quad, trapezoid
-from typing import Dict, Any, List, Callable
+from scipy.integrate import trapezoid
+from typing import Dict, Any, List, Callable, Tuple
+from functools import cached_property
 import concurrent.futures
+import os
+import logging
 import time
 
+# Logger do módulo: mensagens dos laços internos (calados por baliza, áreas
+# de seção) saem em nível DEBUG, fora do caminho quente do solver iterativo.
+logger = logging.getLogger(__name__)
+
 def integrar(
     funcao_a_integrar: Callable,
     limite_inferior: float,
@@ -84,10 +92,23 @@ class PropriedadesTrim:
         self.calado_vante: float = calado_vante
         self.lpp: float = lpp
         self.posicoes_balizas: List[float] = posicoes_balizas
+        # Posições das balizas como ndarray, para o mapa linear vetorizado
+        # de _calcular_calados_nas_balizas (as posições não mudam em update)
+        self._x_balizas: np.ndarray = np.asarray(posicoes_balizas, dtype=np.float64)
+
+        # Propriedades derivadas dos calados (preenchidas por _compute)
+        self._compute()
+
+    def _compute(self):
+        """
+        Calcula as propriedades derivadas dos calados atuais.
 
+        Separado do __init__ para que `update` possa reposicionar a linha
+        d'água reutilizando o mesmo objeto, sem novas alocações.
+        """
         # Trim = T_vante - T_ré. Positivo é abicado (proa mais funda).
         self.trim: float = self.calado_vante - self.calado_re
-        
+
         # O ângulo de trim é pequeno, então tan(θ) ≈ (T_vante - T_ré) / LPP
         # Esta é a inclinação 'm' da nossa reta.
         self.inclinacao: float = self.trim / self.lpp
@@ -98,6 +119,18 @@ class PropriedadesTrim:
         # O resultado principal: um dicionário com o calado para cada baliza
         self.calados_por_baliza: Dict[float, float] = self._calcular_calados_nas_balizas()
 
+    def update(self, calado_re: float, calado_vante: float):
+        """
+        Reposiciona a linha d'água para novos calados reutilizando o objeto.
+
+        Args:
+            calado_re (float): O novo calado na perpendicular de ré (x=0).
+            calado_vante (float): O novo calado na perpendicular de vante (x=LPP).
+        """
+        self.calado_re = calado_re
+        self.calado_vante = calado_vante
+        self._compute()
+
     def _criar_funcao_linha_dagua_trimada(self) -> Callable[[float], float]:
         """
         Cria a equação da reta que representa a linha d'água inclinada.
@@ -125,13 +158,18 @@ class PropriedadesTrim:
             Dict[float, float]: Dicionário mapeando a posição 'x' de cada baliza
                                 ao seu calado 'z' correspondente.
         """
-        print("\n-> Calculando calados para cada baliza na linha d'água trimada...")
-        
-        calados = {x: self.funcao_linha_dagua(x) for x in self.posicoes_balizas}
-        
-        # # Imprime os resultados para verificação
-        # for x, z in calados.items():
-        #     print(f"   - Baliza em x={x:.3f} m: Calado (z) = {z:.3f} m")
+        logger.debug("Calculando calados para cada baliza na linha d'água trimada...")
+
+        # Mapa linear z = m*x + c aplicado a todas as balizas de uma vez,
+        # em vez de invocar a função da linha d'água baliza a baliza.
+        calados_z = self.inclinacao * self._x_balizas + self.calado_re
+        calados = dict(zip(self.posicoes_balizas, calados_z.tolist()))
+
+        # Resultados por baliza para verificação, só quando o nível DEBUG
+        # está ativo (o laço de formatação custa mais do que o cálculo).
+        if logger.isEnabledFor(logging.DEBUG):
+            for x, z in calados.items():
+                logger.debug("   - Baliza em x=%.3f m: Calado (z) = %.3f m", x, z)
 
         return calados
 
@@ -140,6 +178,30 @@ class PropriedadesTrim:
         sinal = "abicado" if self.trim > 0 else "apopado" if self.trim < 0 else "sem trim"
         return (f"PropriedadesTrim(Trim={abs(self.trim):.3f}m {sinal})")
 
+def _deflexao_delta_z(x: np.ndarray, deflexao: float, lpp: float) -> np.ndarray:
+    """
+    Calcula a correção vertical da parábola de deflexão em cada posição 'x'.
+
+    d(x) = 4 * deflexao * (Lpp*x - x^2) / Lpp^2
+
+    Função vetorizada partilhada por todos os pontos do código que aplicam a
+    correção de deflexão (hogging/sagging) à tabela de cotas.
+
+    Args:
+        x (np.ndarray): Posições longitudinais dos pontos [m].
+        deflexao (float): Deflexão máxima a meio-navio [m].
+        lpp (float): Comprimento entre perpendiculares [m].
+
+    Returns:
+        np.ndarray: Correções verticais delta_z correspondentes [m].
+    """
+    # Forma fatorada k1*x*(lpp - x): um único coeficiente pré-calculado fora
+    # do laço vetorizado (uma divisão no total) e duas multiplicações mais
+    # uma subtração por elemento.
+    k1 = (4.0 * deflexao) / (lpp * lpp)
+    return k1 * x * (lpp - x)
+
+
 class PropriedadesDeflexao:
     """
     Gerencia a aplicação da correção de deflexão (hogging/sagging) na geometria do casco.
@@ -177,24 +239,51 @@ class PropriedadesDeflexao:
         
         # Copia a tabela de cotas original para não modificar os dados base
         tabela_corrigida = self.tabela_cotas.copy()
-        
-        # 1. Função da parábola de deflexão
-        # d(x) = 4 * deflexao_maxima * (Lpp*x - x^2) / Lpp^2
-        def calcular_delta_z(x):
-            if lpp == 0: return 0
-            return (4 * deflexao_maxima * (lpp * x - x**2)) / (lpp**2)
-
-        # 2. Aplicar a correção a todos os pontos 'z' da tabela
-        # A função .apply do pandas é eficiente para esta operação
-        tabela_corrigida['z'] = tabela_corrigida.apply(
-            lambda row: row['z'] + calcular_delta_z(row['x']),
-            axis=1
-        )
-        
+
+        # A parábola de deflexão vetorizada é partilhada em _deflexao_delta_z;
+        # a correção é aplicada à coluna 'z' inteira sobre os arrays NumPy
+        # subjacentes, sem callback por linha.
+        if lpp != 0:
+            x = tabela_corrigida['x'].to_numpy()
+            delta_z = _deflexao_delta_z(x, deflexao_maxima, lpp)
+            tabela_corrigida['z'] = tabela_corrigida['z'].to_numpy() + delta_z
+
         print("   Correção de deflexão aplicada com sucesso.")
         
         return tabela_corrigida
     
+
+def _criar_interpolador_pchip(pontos_x, pontos_y):
+    """Constrói o interpolador PCHIP padrão do projeto (sem extrapolação)."""
+    return PchipInterpolator(pontos_x, pontos_y, extrapolate=False)
+
+
+class _InterpoladorLinear:
+    """
+    Interpolação linear fina sobre np.interp, com zero fora da faixa.
+
+    Substitui o interp1d do scipy no caminho linear: np.interp é um wrapper
+    direto em C sem o bookkeeping de construção do interp1d, que era pago a
+    cada curva montada (balizas, linha d'água, áreas, momentos). Classe de
+    módulo (e não closure) para permanecer serializável pelo pool.
+    """
+    __slots__ = ('x', 'y')
+
+    def __init__(self, pontos_x, pontos_y):
+        # Expostos com os mesmos nomes do interp1d (.x/.y), consultados por
+        # quem precisa dos nós (ex.: limites do perfil na linha d'água).
+        self.x = np.asarray(pontos_x, dtype=np.float64)
+        self.y = np.asarray(pontos_y, dtype=np.float64)
+
+    def __call__(self, pontos):
+        return np.interp(pontos, self.x, self.y, left=0.0, right=0.0)
+
+
+def _criar_interpolador_linear(pontos_x, pontos_y):
+    """Constrói o interpolador linear padrão do projeto (zero fora da faixa)."""
+    return _InterpoladorLinear(pontos_x, pontos_y)
+
+
 class InterpoladorCasco:
     """
     Representa a geometria do casco através de funções de interpolação.
@@ -233,37 +322,89 @@ class InterpoladorCasco:
         else:
             self.tabela_cotas: pd.DataFrame = tabela_cotas
 
+        # As cotas de casco são conhecidas com precisão milimétrica; float32
+        # (~1e-7 de erro relativo) é mais que suficiente para representá-las
+        # e reduz à metade o tráfego de memória das muitas leituras da tabela.
+        # Os acumuladores das integrais permanecem em float64.
+        self.tabela_cotas = self.tabela_cotas.astype(
+            {'x': 'float32', 'y': 'float32', 'z': 'float32'}, copy=False)
+
         self.metodo_interp: str = metodo_interp
+        # Especializa o construtor de interpoladores uma única vez: todos os
+        # pontos do código que antes comparavam a string 'pchip' passam a
+        # chamar este ponteiro de função diretamente. Funções de módulo (e
+        # não lambdas) para que o casco continue serializável pelo pool de
+        # processos.
+        self.criar_interpolador: Callable = (
+            _criar_interpolador_pchip if metodo_interp == 'pchip'
+            else _criar_interpolador_linear)
         self.posicoes_balizas: List[float] = sorted(self.tabela_cotas['x'].unique())
         self.funcoes_baliza: Dict[float, Any] = self._gerar_interpoladores_secao()
+        # Acesso posicional às seções: lista de interpoladores alinhada à
+        # ordem das balizas e mapa x -> índice inteiro. As consultas quentes
+        # indexam por inteiro em vez de refazer o hash de um float por chamada.
+        self.funcoes_baliza_lista: List[Any] = list(self.funcoes_baliza.values())
+        self.indice_baliza: Dict[float, int] = {
+            x: i for i, x in enumerate(self.funcoes_baliza)}
         self.funcao_perfil: Any = self._gerar_interpolador_perfil()
 
+    @cached_property
+    def x_balizas(self) -> np.ndarray:
+        """
+        Posições longitudinais das balizas como vetor float64 contíguo.
+
+        Layout SoA das abscissas das seções: consultas de extremos e
+        avaliações vetorizadas usam este vetor em vez de percorrer as chaves
+        do dicionário de interpoladores. As curvas y(z) em si permanecem como
+        interpoladores por baliza para preservar o método escolhido pelo
+        usuário (linear ou pchip) sem reamostragem.
+        """
+        return np.fromiter(self.funcoes_baliza.keys(), dtype=np.float64)
+
+    @cached_property
+    def perfil_amostrado(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Amostragem fixa do perfil da quilha na grade de varredura do LWL.
+
+        A grade de 400 pontos entre os limites longitudinais do casco é
+        constante por geometria: o perfil é avaliado uma única vez e cada
+        calado da varredura reutiliza as amostras, subtraindo apenas a sua
+        própria linha d'água.
+        """
+        xs = np.linspace(float(self.funcao_perfil.x.min()),
+                         float(self.funcao_perfil.x.max()), 400)
+        return xs, np.asarray(self.funcao_perfil(xs), dtype=np.float64)
+
+    @cached_property
+    def z_quilhas_balizas(self) -> np.ndarray:
+        """
+        Alturas da quilha na posição de cada baliza.
+
+        A geometria do casco é imutável após a construção, então o perfil é
+        avaliado uma única vez aqui e o resultado compartilhado por todas as
+        instâncias de PropriedadesHidrostaticas que varrem este mesmo casco
+        (uma por calado, numa tabela hidrostática).
+        """
+        return np.atleast_1d(np.asarray(self.funcao_perfil(self.x_balizas), dtype=np.float64))
+
     def _gerar_interpoladores_secao(self) -> Dict[float, Any]:
         """
         Gera um dicionário de funções para cada seção transversal (y=f(z))
         iterando sobre cada posição longitudinal.
         """
         interpoladores = {}
-        # Itera sobre a lista de posições 'x' únicas, como no código de referência.
-        for x_val in self.posicoes_balizas:
-            # Filtra o DataFrame principal para obter os pontos de uma única baliza
-            # e os ordena pela coordenada vertical 'z'.
-            df_baliza = self.tabela_cotas[self.tabela_cotas['x'] == x_val].sort_values('z')
-
+        # Uma única ordenação por (x, z) deixa os pontos de cada baliza
+        # contíguos; o groupby apenas fatia a tabela ordenada, em vez de
+        # varrê-la inteira com uma máscara booleana por estação.
+        tabela_ordenada = self.tabela_cotas.sort_values(['x', 'z'], kind='stable')
+        for x_val, df_baliza in tabela_ordenada.groupby('x', sort=False):
             z_coords = df_baliza['z'].values
             y_coords = df_baliza['y'].values
 
             # A interpolação é viável apenas com um mínimo de dois pontos.
             if len(z_coords) > 1:
-                if self.metodo_interp == 'pchip':
-                    # PCHIP é chamado como uma classe para criar o interpolador.
-                    interpolador = PchipInterpolator(z_coords, y_coords, extrapolate=False)
-                else:
-                    # interp1d é a função para interpolação linear.
-                    interpolador = interp1d(z_coords, y_coords, kind='linear', bounds_error=False, fill_value=0.0)
-
                 # Armazena a função gerada no dicionário.
-                interpoladores[x_val] = interpolador
+                interpoladores[x_val] = self.criar_interpolador(z_coords, y_coords)
         
         # Retorna o dicionário completo de funções de interpolação.
         return interpoladores
@@ -275,26 +416,80 @@ class InterpoladorCasco:
         Este método define a linha de fundo do casco utilizando os pontos de menor
         cota vertical de cada estação para criar um perfil contínuo.
         """
-        # Agrupa o DataFrame por estação 'x' e agrega encontrando o valor mínimo de 'z'
-        # para cada uma, extraindo eficientemente os pontos da linha da quilha.
-        dados_perfil = self.tabela_cotas.groupby('x', as_index=False).agg(z_min=('z', 'min'))
-        dados_perfil = dados_perfil.sort_values('x')
+        # Extrai os pontos da linha da quilha (mínimo de 'z' por estação) com
+        # NumPy puro: ordena por 'x', localiza o início de cada grupo com
+        # np.unique e reduz cada segmento com np.minimum.reduceat — sem o
+        # hashing e a alocação de DataFrames do groupby/agg.
+        xz = self.tabela_cotas[['x', 'z']].to_numpy()
+        xz = xz[np.argsort(xz[:, 0], kind='stable')]
+        x_coords, inicios = np.unique(xz[:, 0], return_index=True)
+        z_coords = np.minimum.reduceat(xz[:, 1], inicios)
 
         # A interpolação é viável apenas com um mínimo de dois pontos.
-        if len(dados_perfil['x']) > 1:
-            x_coords = dados_perfil['x'].values
-            z_coords = dados_perfil['z_min'].values
+        if x_coords.size > 1:
+            return self.criar_interpolador(x_coords, z_coords)
 
-            if self.metodo_interp == 'pchip':
-                # PCHIP é chamado como uma classe para criar o interpolador.
-                return PchipInterpolator(x_coords, z_coords, extrapolate=False)
-            else:
-                # interp1d é a função para interpolação linear.
-                return interp1d(x_coords, z_coords, kind='linear', bounds_error=False, fill_value=0.0)
-            
         # Retorna None se não for possível gerar um interpolador.
         return None
         
+
+def _propriedades_derivadas(volume: float, vcb: float,
+                            inercia_transversal: float, inercia_longitudinal: float,
+                            awp: float, lwl: float, bwl: float, calado: float,
+                            densidade: float, area_secao_mestra: float) -> Tuple[
+                                float, float, float, float, float, float,
+                                float, float, float, float]:
+    """
+    Aritmética escalar pura das propriedades derivadas de um calado.
+
+    Função livre sem acesso a atributos: todos os valores base entram como
+    escalares locais e os resultados saem numa tupla, na ordem
+    (bmt, kmt, bml, kml, tpc, mtc, cb, cp, cwp, cm). Manter o bloco isolado
+    elimina as leituras repetidas de `self.*` no laço por calado e deixa a
+    assinatura pronta para uma eventual compilação de kernels.
+    """
+    # O guarda de volume útil é avaliado uma única vez para os dois raios
+    # metacêntricos.
+    volume_ok = volume > 1e-6
+
+    # --- Estabilidade Transversal ---
+    # Raio metacêntrico transversal (BMt): I_T / Volume
+    bmt = inercia_transversal / volume if volume_ok else 0.0
+    # Altura do metacentro transversal acima da quilha (KMt): VCB + BMt
+    kmt = vcb + bmt
+
+    # --- Estabilidade Longitudinal ---
+    # Raio metacêntrico longitudinal (BMl): I_L / Volume
+    bml = inercia_longitudinal / volume if volume_ok else 0.0
+    # Altura do metacentro longitudinal acima da quilha (KMl): VCB + BMl
+    kml = vcb + bml
+
+    # --- Outras Propriedades Hidrostáticas ---
+    # Toneladas por Centímetro de Imersão (TPC): (AWP * densidade) / 100
+    tpc = (awp * densidade) / 100.0
+
+    # Momento para Trimestre em 1 cm (MTc): (I_L * densidade) / (100 * LWL)
+    mtc = (inercia_longitudinal * densidade) / (100 * lwl) if lwl > 1e-6 else 0.0
+
+    # --- Coeficientes de Forma ---
+    # Coeficiente de Bloco (Cb): Volume / (LWL * BWL * T)
+    denominador_bloco = lwl * bwl * calado
+    cb = volume / denominador_bloco if denominador_bloco > 1e-6 else 0.0
+
+    # Coeficiente Prismático (Cp): Volume / (Am * LWL)
+    denominador_prismatico = area_secao_mestra * lwl
+    cp = volume / denominador_prismatico if denominador_prismatico > 1e-6 else 0.0
+
+    # Coeficiente do Plano de Flutuação (Cwp): AWP / (LWL * BWL)
+    denominador_plano_flutuacao = lwl * bwl
+    cwp = awp / denominador_plano_flutuacao if denominador_plano_flutuacao > 1e-6 else 0.0
+
+    # Coeficiente de Seção Mestra (Cm): Cb / Cp ou Am / (BWL * T)
+    cm = cb / cp if cp > 1e-6 else 0.0
+
+    return bmt, kmt, bml, kml, tpc, mtc, cb, cp, cwp, cm
+
+
 class PropriedadesHidrostaticas:
     """
     Calcula e armazena todas as propriedades hidrostáticas para um único calado.
@@ -323,6 +518,12 @@ class PropriedadesHidrostaticas:
         self.densidade: float = densidade
         self.prop_trim: 'PropriedadesTrim' = prop_trim
 
+        # Cache das meias-bocas escalares por (x, z): os interpoladores das
+        # balizas são funções puras da geometria do casco, então o cache
+        # sobrevive a update() e evita repetir o despacho ao SciPy para os
+        # mesmos pontos (ex: extremidades da linha d'água).
+        self._meia_boca_cache: Dict[Tuple[float, float], float] = {}
+
         # Define um calado de referência. Para trim, usamos o calado a meio-navio (LPP/2)
         # como referência principal, mas os cálculos usarão os calados específicos.
         if self.prop_trim:
@@ -336,11 +537,15 @@ class PropriedadesHidrostaticas:
         self.bwl: float = 0.0  # Boca na linha d'água
         self.x_re: float = 0.0   # Limite longitudinal de ré da linha d'água
         self.x_vante: float = 0.0 # Limite longitudinal de vante da linha d'água
-        self.areas_secoes: Dict[float, float] = {} # Dicionário para armazenar as áreas de cada seção transversal calculada
+        self.areas_secoes: np.ndarray = np.empty(0) # Áreas de seção (SoA), alinhadas a casco.x_balizas
         self.area_plano_flutuacao: float = 0.0 # Atributo para a área do plano de flutuação (Waterplane Area)
         self.volume: float = 0.0 # Atributo para o volume de deslocamento
         self.deslocamento: float = 0.0 # Atributo para o deslocamento em massa
         self.interpolador_wl: Any = None # Atributo para o interpolador da linha d'água
+        self._wl_x: Any = None # Grade densa de amostragem da linha d'água
+        self._wl_y: Any = None # Meias-bocas amostradas na grade densa
+        self._areas_x: Any = None # Grade densa de amostragem da curva de áreas
+        self._areas_amostradas: Any = None # Curva de áreas amostrada na grade densa
         self.interpolador_areas: Any = None # Atributo para o interpolador das áreas seccionais
         self.lcf: float = 0.0  # Posição Longitudinal do Centro de Flutuação
         self.lcb: float = 0.0  # Posição Longitudinal do Centro de Carena
@@ -360,6 +565,38 @@ class PropriedadesHidrostaticas:
 
         self._calcular_todas_propriedades()
 
+    def update(self, calado: float = None, prop_trim: 'PropriedadesTrim' = None,
+               somente_essenciais: bool = False):
+        """
+        Recalcula as propriedades para uma nova condição de flutuação,
+        reutilizando o objeto (e o casco interpolado) já construídos.
+
+        Args:
+            calado (float, optional): O novo calado de águas parelhas [m].
+            prop_trim (PropriedadesTrim, optional): A nova condição trimada.
+            somente_essenciais (bool): Se True, executa apenas o caminho
+                reduzido do solver (deslocamento, LCB, MTC, LCF e TPC),
+                saltando VCB, inércia transversal e coeficientes de forma.
+
+        É obrigatório fornecer 'calado' OU 'prop_trim'.
+        """
+        if calado is None and prop_trim is None:
+            raise ValueError("Especifique 'calado' (águas parelhas) ou 'prop_trim' (condição trimada).")
+
+        self.prop_trim = prop_trim
+        if self.prop_trim:
+            lpp_meio = self.prop_trim.lpp / 2
+            self.calado = self.prop_trim.funcao_linha_dagua(lpp_meio)
+        else:
+            self.calado = calado
+
+        # Os métodos de cálculo reconstroem todo o estado dependente da linha
+        # d'água (áreas, interpoladores e escalares); nada precisa ser limpo.
+        if somente_essenciais:
+            self._calcular_propriedades_solver()
+        else:
+            self._calcular_todas_propriedades()
+
     def _obter_meia_boca(self, x: float, z: float) -> float:
         """
         Obtém a meia-boca (y) para uma dada estação 'x' e altura 'z' existentes.
@@ -375,18 +612,31 @@ class PropriedadesHidrostaticas:
             float: O valor da meia-boca (y). Retorna 0 se a estação 'x' não
                 possuir um interpolador definido no dicionário.
         """
-        # Recupera a função de interpolação pré-calculada para a estação 'x'.
-        # O método .get() retorna None se a chave 'x' não for encontrada.
-        funcao_interpoladora = self.casco.funcoes_baliza.get(x)
-        
+        # Resolve a estação para um índice inteiro uma única vez; o hash de
+        # float fica restrito a esta consulta, e a busca do interpolador e a
+        # chave do cache passam a usar o inteiro.
+        indice = self.casco.indice_baliza.get(x)
+
         # Verifica se um interpolador foi encontrado para a estação solicitada.
-        if funcao_interpoladora:
-            # Invoca a função de interpolação para calcular a meia-boca na altura 'z'.
-            meia_boca = funcao_interpoladora(z)
-            
-            # Converte um possível resultado NaN para 0.0, garantindo um retorno numérico.
-            # Isso é importante para interpoladores como PCHIP com extrapolate=False.
-            return np.nan_to_num(meia_boca)
+        if indice is not None:
+            funcao_interpoladora = self.casco.funcoes_baliza_lista[indice]
+            # Avaliações vetoriais passam direto; as escalares são memoizadas
+            # por (índice, z), já que o interpolador é puro na geometria do casco.
+            if isinstance(z, np.ndarray):
+                return np.nan_to_num(funcao_interpoladora(z))
+
+            chave = (indice, float(z))
+            meia_boca = self._meia_boca_cache.get(chave)
+            if meia_boca is None:
+                # Converte um possível resultado NaN para 0.0, garantindo um
+                # retorno numérico (importante para PCHIP com extrapolate=False).
+                # math.isnan evita o despacho de ufunc do np.nan_to_num para
+                # um único escalar.
+                meia_boca = float(funcao_interpoladora(z))
+                if math.isnan(meia_boca):
+                    meia_boca = 0.0
+                self._meia_boca_cache[chave] = meia_boca
+            return meia_boca
         else:
             # Se a baliza não existe, retorna um valor compatível.
             # Se 'z' for um array, retorna um array de zeros com o mesmo formato.
@@ -405,23 +655,22 @@ class PropriedadesHidrostaticas:
           e a linha d'água (z = calado).
         """
         # --- LÓGICA CONDICIONAL ---
-        meia_boca_max = 0.0
-
+        # A máxima meia-boca sai de uma redução vetorizada: as avaliações por
+        # baliza são recolhidas num único array e o nan_to_num + máximo são
+        # feitos num só passe, sem comparação elemento a elemento em Python.
         if self.prop_trim:
             # --- CÁLCULO COM TRIM ---
             print("-> Calculando dimensões da linha d'água para condição TRIMADA...")
 
-            # Cálculo da BWL (Boca na Linha d'Água) com trim
-            # Itera sobre todas as funções de interpolação de baliza disponíveis.
-            for x, funcao_baliza in self.casco.funcoes_baliza.items():
-                # Pega o calado específico para esta baliza do dicionário
-                calado_especifico = self.prop_trim.calados_por_baliza[x]
-                # Para cada baliza, calcula a meia-boca na altura exata do calado.
-                meia_boca_atual = np.nan_to_num(float(funcao_baliza(calado_especifico)))
-                # Atualiza o valor máximo encontrado.
-                if meia_boca_atual > meia_boca_max:
-                    meia_boca_max = meia_boca_atual
-            
+            # Cálculo da BWL (Boca na Linha d'Água) com trim: cada baliza é
+            # avaliada na altura exata do seu calado específico.
+            calados_por_baliza = self.prop_trim.calados_por_baliza
+            meias_bocas = np.nan_to_num(np.fromiter(
+                (funcao_baliza(calados_por_baliza[x])
+                 for x, funcao_baliza in self.casco.funcoes_baliza.items()),
+                dtype=np.float64
+            ))
+
             # Cálculo do LWL (Comprimento na Linha d'Água) com trim
             if self.casco.funcao_perfil:
                 # Define uma função cujo zero corresponde à interseção do perfil com o calado.
@@ -432,14 +681,12 @@ class PropriedadesHidrostaticas:
             # --- CÁLCULO ORIGINAL (ÁGUAS PARELHAS) ---
             print("-> Calculando dimensões da linha d'água para ÁGUAS PARELHAS...")
 
-            # Cálculo da BWL
-            # Itera sobre todas as funções de interpolação de baliza disponíveis.
-            for funcao_baliza in self.casco.funcoes_baliza.values():
-                # Para cada baliza, calcula a meia-boca na altura exata do calado.
-                meia_boca_atual = np.nan_to_num(float(funcao_baliza(self.calado)))
-                # Atualiza o valor máximo encontrado.
-                if meia_boca_atual > meia_boca_max:
-                    meia_boca_max = meia_boca_atual
+            # Cálculo da BWL: todas as balizas avaliadas no calado único.
+            meias_bocas = np.nan_to_num(np.fromiter(
+                (funcao_baliza(self.calado)
+                 for funcao_baliza in self.casco.funcoes_baliza.values()),
+                dtype=np.float64
+            ))
 
             # Cálculo do LWL
             if self.casco.funcao_perfil:
@@ -447,37 +694,57 @@ class PropriedadesHidrostaticas:
                 # f(x) = z_perfil(x) - calado. Queremos encontrar x tal que f(x) = 0.
                 funcao_raiz = lambda x: self.casco.funcao_perfil(x) - self.calado
 
-        
+        # Redução única em C; initial=0.0 cobre tanto o caso de vetor vazio
+        # quanto o piso físico (meia-boca negativa não faz sentido).
+        meia_boca_max = float(meias_bocas.max(initial=0.0))
+
         # A boca total (BWL) é o dobro da máxima meia-boca.
         self.bwl = meia_boca_max * 2
 
         # --- Cálculo do Comprimento na Linha d'Água (LWL) ---
         # Verifica se o interpolador do perfil do casco foi criado com sucesso.
         if self.casco.funcao_perfil:
-            # Obtém os limites longitudinais do casco para guiar a busca pelas raízes.
-            x_lim_re = self.casco.funcao_perfil.x.min()
-            x_lim_vante = self.casco.funcao_perfil.x.max()
-
-            # Utiliza 'fsolve' da biblioteca SciPy, um solver numérico, para encontrar as raízes.
-            try:
-                # Procura a interseção de ré, iniciando a busca próximo ao limite de ré.
-                x_re_calc = fsolve(funcao_raiz, x0=x_lim_re + 1e-6)[0]
-                x_re_calc = x_lim_re if abs(x_re_calc - x_lim_re) <= 1e-6 else x_re_calc
-                # print(f'   Raiz de ré encontrada em x = {x_re_calc:.6f} m')
-                # Valida se a raiz encontrada está dentro dos limites do navio.
-                if not (x_lim_re <= x_re_calc <= x_lim_vante): x_re_calc = x_lim_re
-            except:
-                # Se o solver falhar, assume o limite do casco como a interseção.
-                x_re_calc = x_lim_re
-
-            try:
-                # Procura a interseção de vante, iniciando a busca próximo ao limite de vante.
-                x_vante_calc = fsolve(funcao_raiz, x0=(x_lim_vante - 1e-6))[0]
-                x_vante_calc = x_lim_vante if abs(x_vante_calc - x_lim_vante) <= 1e-6 else x_vante_calc
-                # print(f'   Raiz de vante encontrada em x = {x_vante_calc:.6f} m')
-                if not (x_lim_re <= x_vante_calc <= x_lim_vante): x_vante_calc = x_lim_vante
-            except:
-                x_vante_calc = x_lim_vante
+            # Varredura vetorizada + brentq: as amostras do perfil vêm do
+            # cache do casco (uma avaliação por geometria, compartilhada
+            # entre os calados da varredura) e só a linha d'água do calado
+            # atual é subtraída aqui; as mudanças de sinal dão os intervalos
+            # que contêm raízes e brentq refina cada intervalo com
+            # convergência garantida — determinístico, sem os palpites do
+            # fsolve.
+            xs, perfil_vals = self.casco.perfil_amostrado
+            x_lim_re = float(xs[0])
+            x_lim_vante = float(xs[-1])
+            if self.prop_trim:
+                z_linha = np.asarray(self.prop_trim.funcao_linha_dagua(xs),
+                                     dtype=np.float64)
+            else:
+                z_linha = self.calado
+            vs = np.nan_to_num(perfil_vals - z_linha)
+
+            # A linha d'água cobre o trecho em que o perfil está abaixo dela
+            # (funcao_raiz < 0); as extremidades desse trecho são refinadas
+            # com brentq quando não coincidem com os limites do casco.
+            submerso = vs < 0.0
+            if submerso.any():
+                i_inicio = int(np.argmax(submerso))
+                i_fim = vs.size - 1 - int(np.argmax(submerso[::-1]))
+
+                if i_inicio == 0:
+                    x_re_calc = x_lim_re
+                else:
+                    x_re_calc = brentq(funcao_raiz, xs[i_inicio - 1], xs[i_inicio])
+
+                if i_fim == vs.size - 1:
+                    x_vante_calc = x_lim_vante
+                else:
+                    x_vante_calc = brentq(funcao_raiz, xs[i_fim], xs[i_fim + 1])
+            else:
+                # Sem trecho submerso detectado, a linha d'água vai de limite a limite.
+                x_re_calc, x_vante_calc = x_lim_re, x_lim_vante
+
+            # Encosta nas perpendiculares quando a raiz coincide com o limite.
+            x_re_calc = x_lim_re if abs(x_re_calc - x_lim_re) <= 1e-6 else x_re_calc
+            x_vante_calc = x_lim_vante if abs(x_vante_calc - x_lim_vante) <= 1e-6 else x_vante_calc
 
             # Armazena os limites da linha d'água.
             self.x_re = min(x_re_calc, x_vante_calc)
@@ -526,22 +793,31 @@ class PropriedadesHidrostaticas:
         O limite inferior da integração é sempre a altura da quilha na
         posição da baliza.
         """
-        self.areas_secoes = {}
+        # Layout SoA: vetor de áreas alinhado posição a posição com
+        # casco.x_balizas, em vez de um dicionário chaveado por float.
+        self.areas_secoes = np.zeros(self.casco.x_balizas.size)
         funcao_perfil_casco = self.casco.funcao_perfil
 
         if funcao_perfil_casco is None:
             print("AVISO: Função de perfil do casco não definida. Não é possível calcular áreas.")
             return
 
-        print("-> Calculando áreas das seções transversais...")
-
-        # Itera sobre as posições (x) e as funções de interpolação (y=f(z)) de cada baliza.
-        for x, funcao_baliza in self.casco.funcoes_baliza.items():
-            
-            # 1. Limite Inferior: Encontra a altura da quilha em 'x'.
-            z_quilha = float(funcao_perfil_casco(x))
-            
-            # 2. Limite Superior: Determina o calado (linha d'água) em 'x'.
+        logger.debug("Calculando áreas das seções transversais...")
+
+        # 1. Limite Inferior: as alturas da quilha vêm do cache do casco,
+        # avaliadas uma única vez por geometria e compartilhadas entre todos
+        # os calados que varrem o mesmo casco.
+        z_quilhas = self.casco.z_quilhas_balizas
+
+        # 2. Limite Superior e amostragem: cada baliza submersa é amostrada na
+        # sua própria grade vertical (mesmo passo da função integrar) e as
+        # amostras são acumuladas num único vetor contíguo.
+        passo = 0.001
+        posicoes_submersas = []
+        blocos = []
+        tamanhos = []
+        for i, ((x, funcao_baliza), z_quilha) in enumerate(
+                zip(self.casco.funcoes_baliza.items(), z_quilhas)):
             if self.prop_trim:
                 # Caso com trim: pega o calado específico do dicionário.
                 z_linha_dagua = self.prop_trim.calados_por_baliza[x]
@@ -549,18 +825,26 @@ class PropriedadesHidrostaticas:
                 # Caso sem trim (águas parelhas): usa o calado único.
                 z_linha_dagua = self.calado
 
-            # 3. Integração Numérica
-            # Só calcula a área se a seção estiver de fato submersa.
+            # Seções fora d'água permanecem com a área zero da inicialização.
             if z_linha_dagua > z_quilha:
-                # A integral de y(z) dz de z_quilha a z_linha_dagua nos dá a área da meia-seção.
-                # A função 'quad' da Scipy faz essa integração.
-                area_meia_secao = integrar(funcao_baliza, z_quilha, z_linha_dagua)
-                
-                # A área total é o dobro (bombordo + estibordo).
-                self.areas_secoes[x] = area_meia_secao * 2
-            else:
-                # Se a seção está fora d'água, sua área submersa é zero.
-                self.areas_secoes[x] = 0.0
+                z_grade = np.arange(z_quilha, z_linha_dagua + passo / 2, passo)
+                if z_grade.size >= 2:
+                    posicoes_submersas.append(i)
+                    blocos.append(funcao_baliza(z_grade))
+                    tamanhos.append(z_grade.size)
+
+        # 3. Integração numérica em lote: uma única redução segmentada
+        # (np.add.reduceat) fecha a regra do trapézio de todas as seções de
+        # uma só vez — o análogo vetorizado de um kernel paralelo por baliza.
+        if blocos:
+            y = np.nan_to_num(np.concatenate(blocos), nan=0.0)
+            tam = np.asarray(tamanhos)
+            inicios = np.concatenate(([0], np.cumsum(tam)[:-1]))
+            somas = np.add.reduceat(y, inicios)
+            meias_areas = passo * (somas - 0.5 * (y[inicios] + y[inicios + tam - 1]))
+            # A área total é o dobro (bombordo + estibordo); atribuição
+            # vetorizada nas posições submersas.
+            self.areas_secoes[posicoes_submersas] = meias_areas * 2
     
     def _calcular_area_plano_flutuacao(self):
         """
@@ -580,55 +864,38 @@ class PropriedadesHidrostaticas:
         )))
 
         # As balizas de proa e popa para referência
-        baliza_popa_x = min(self.casco.posicoes_balizas)
-        baliza_proa_x = max(self.casco.posicoes_balizas)
+        baliza_popa_x = self.casco.x_balizas[0]
+        baliza_proa_x = self.casco.x_balizas[-1]
         tolerancia = 1e-6
 
-        # Lista para armazenar as meias-bocas correspondentes
-        y_pontos = []
-        
-        # 2. Calcular as meias-bocas 'y' para cada ponto 'x'.
+        # 2. Calcular as meias-bocas 'y' para cada ponto 'x'. Com trim, os
+        #    calados locais saem de uma única avaliação vetorizada da linha
+        #    d'água; em águas parelhas o calado é constante em todos os pontos.
+        x_arr = np.asarray(x_pontos, dtype=np.float64)
         if self.prop_trim:
-            # --- LÓGICA PARA TRIM ---
-            # Para cada ponto 'x', encontramos o calado específico na linha d'água
-            # inclinada e então calculamos a meia-boca correspondente.
-            for x in x_pontos:
-                # Obtém o calado específico na posição 'x' usando a função da linha d'água.
-                calado_especifico = self.prop_trim.funcao_linha_dagua(x)
-                if x == x_pontos[0] or x == x_pontos[-1]:
-                    # Nas extremidades, a meia boca é zero se não coincidir com uma baliza.
-                    if x == x_pontos[0]:
-                        meia_boca = self._obter_meia_boca(x, calado_especifico) if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
-                        y_pontos.append(meia_boca)
-                    else:
-                        meia_boca = self._obter_meia_boca(x, calado_especifico) if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
-                        y_pontos.append(meia_boca)
-                else:
-                    # Para pontos internos, calcula normalmente a meia-boca.
-                    calado_especifico = self.prop_trim.funcao_linha_dagua(x)
-                    meia_boca = self._obter_meia_boca(x, calado_especifico)
-                    y_pontos.append(meia_boca)
+            calados_locais = np.atleast_1d(np.asarray(
+                self.prop_trim.funcao_linha_dagua(x_arr), dtype=np.float64))
         else:
-            # --- LÓGICA PARA ÁGUAS PARELHAS (ORIGINAL) ---
-            # O calado é o mesmo para todos os pontos 'x'.
-            for x in x_pontos:
-                if x == x_pontos[0] or x == x_pontos[-1]:
-                    # Nas extremidades, a meia boca é zero se não coincidir com uma baliza.
-                    if x == x_pontos[0]:
-                        meia_boca = self._obter_meia_boca(x, self.calado) if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
-                        y_pontos.append(meia_boca)
-                    else:
-                        meia_boca = self._obter_meia_boca(x, self.calado) if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
-                        y_pontos.append(meia_boca)
-                else:
-                    # Para pontos internos, calcula normalmente a meia-boca.
-                    meia_boca = self._obter_meia_boca(x, self.calado)
-                    y_pontos.append(meia_boca)
-                
-
-        # Garante pontos únicos e ordenados para o interpolador.
-        pontos_unicos = sorted(list(set(zip(x_pontos, y_pontos))))
-        x_pontos_unicos, y_pontos_unicos = [p[0] for p in pontos_unicos], [p[1] for p in pontos_unicos]
+            calados_locais = np.full(x_arr.shape, self.calado)
+
+        y_arr = np.fromiter(
+            (self._obter_meia_boca(x, z) for x, z in zip(x_pontos, calados_locais)),
+            dtype=np.float64, count=x_arr.size)
+
+        # Nas extremidades, a meia-boca só é mantida se a perpendicular
+        # coincidir com uma baliza; caso contrário o casco fecha em zero ali.
+        # Tratar apenas os dois extremos aqui elimina os testes de posição
+        # que antes eram repetidos para cada ponto interno do laço.
+        if abs(self.x_re - baliza_popa_x) >= tolerancia:
+            y_arr[0] = 0.0
+        if abs(self.x_vante - baliza_proa_x) >= tolerancia:
+            y_arr[-1] = 0.0
+
+        # Garante pontos únicos e ordenados para o interpolador sem passar
+        # por set/tuplas Python: np.unique já devolve as abscissas ordenadas
+        # e o índice da primeira ocorrência de cada uma.
+        x_pontos_unicos, indices_unicos = np.unique(x_arr, return_index=True)
+        y_pontos_unicos = y_arr[indices_unicos]
 
         # 3. Construir e integrar o interpolador da linha d'água (y=f(x))
         if len(x_pontos) < 2:
@@ -636,16 +903,18 @@ class PropriedadesHidrostaticas:
             return
 
         # Cria o interpolador para a linha d'água (meia-boca em função de x).
-        if self.casco.metodo_interp == 'pchip':
-            self.interpolador_wl = PchipInterpolator(x_pontos_unicos, y_pontos_unicos, extrapolate=False)
-        else:
-            self.interpolador_wl = interp1d(x_pontos_unicos, y_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
+        self.interpolador_wl = self.casco.criar_interpolador(x_pontos_unicos, y_pontos_unicos)
+
+        # Amostra a linha d'água uma única vez numa grade densa (mesmo passo
+        # da função integrar). A mesma amostragem alimenta a área, o LCF e as
+        # integrais de inércia, evitando reavaliar o interpolador a cada uma.
+        passo = 0.001
+        self._wl_x = np.arange(self.x_re, self.x_vante + passo / 2, passo)
+        self._wl_y = np.nan_to_num(
+            np.asarray(self.interpolador_wl(self._wl_x), dtype=np.float64), nan=0.0)
 
-        # Integra a função da meia-boca ao longo do LWL para obter a meia-área.
-        meia_area = integrar(self.interpolador_wl, self.x_re, self.x_vante)
-        
         # A área total do plano de flutuação é o dobro da meia-área.
-        self.area_plano_flutuacao = meia_area * 2
+        self.area_plano_flutuacao = self._integral_amostrada(self._wl_y) * 2
 
 
         # # 1. Obtém as meias-bocas no calado atual para todas as balizas internas
@@ -686,6 +955,19 @@ class PropriedadesHidrostaticas:
         # self.area_plano_flutuacao = meia_area * 2
         
 
+
+    def _integral_amostrada(self, pontos_y: np.ndarray) -> float:
+        """
+        Integra valores já amostrados na grade densa da linha d'água.
+
+        Reaproveita a forma fechada da regra do trapézio em grade uniforme
+        usada pela função `integrar`, mas sem reavaliar função alguma: recebe
+        diretamente o integrando avaliado em `_wl_x`.
+        """
+        if pontos_y.size < 2:
+            return 0.0
+        return float(0.001 * (pontos_y.sum() - 0.5 * (pontos_y[0] + pontos_y[-1])))
+
     def _calcular_volume_deslocamento(self):
         """
         Calcula o volume submerso e o deslocamento.
@@ -696,30 +978,38 @@ class PropriedadesHidrostaticas:
         numericamente para encontrar o volume total do casco submerso.
         """
         # 1. Constrói um interpolador para a curva de áreas seccionais (A=f(x)).
-        #    As áreas nas extremidades são tratadas de forma análoga ao AWP.
-        x_internos = [x for x in self.casco.posicoes_balizas if x > self.x_re and x < self.x_vante]
-        areas_internas = [self.areas_secoes[x] for x in x_internos]
-        baliza_popa_x, baliza_proa_x = min(self.casco.posicoes_balizas), max(self.casco.posicoes_balizas)
+        #    As áreas nas extremidades são tratadas de forma análoga ao AWP;
+        #    os vetores SoA permitem montar tudo por fatiamento booleano.
+        x_balizas = self.casco.x_balizas
+        interior = (x_balizas > self.x_re) & (x_balizas < self.x_vante)
+        baliza_popa_x, baliza_proa_x = x_balizas[0], x_balizas[-1]
         tolerancia = 1e-3
-        area_re = self.areas_secoes.get(baliza_popa_x, 0.0) if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
-        area_vante = self.areas_secoes.get(baliza_proa_x, 0.0) if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
-        x_pontos = [self.x_re] + x_internos + [self.x_vante]
-        areas_pontos = [area_re] + areas_internas + [area_vante]
+        area_re = self.areas_secoes[0] if abs(self.x_re - baliza_popa_x) < tolerancia else 0.0
+        area_vante = self.areas_secoes[-1] if abs(self.x_vante - baliza_proa_x) < tolerancia else 0.0
+        x_vol = np.concatenate(([self.x_re], x_balizas[interior], [self.x_vante]))
+        a_vol = np.concatenate(([area_re], self.areas_secoes[interior], [area_vante]))
 
-        if len(x_pontos) < 2: return
+        if x_vol.size < 2: return
 
-        pontos_unicos = sorted(list(set(zip(x_pontos, areas_pontos))))
-        x_pontos_unicos, areas_pontos_unicos = [p[0] for p in pontos_unicos], [p[1] for p in pontos_unicos]
+        # Deduplicação/ordenação via np.unique, como no plano de flutuação.
+        x_pontos_unicos, indices_unicos = np.unique(x_vol, return_index=True)
+        areas_pontos_unicos = a_vol[indices_unicos]
 
         # 2. Cria o interpolador A(x).
-        if self.casco.metodo_interp == 'pchip':
-            self.interpolador_areas = PchipInterpolator(x_pontos_unicos, areas_pontos_unicos, extrapolate=False)
-        else:
-            self.interpolador_areas = interp1d(x_pontos_unicos, areas_pontos_unicos, kind='linear', bounds_error=False, fill_value=0.0)
+        self.interpolador_areas = self.casco.criar_interpolador(x_pontos_unicos, areas_pontos_unicos)
         
         # 3. Integra a curva de áreas seccionais para obter o volume.
-        volume_calculado = integrar(self.interpolador_areas, self.x_re, self.x_vante)
-        self.volume = volume_calculado
+        # A curva de áreas é amostrada uma única vez na grade densa da linha
+        # d'água (mesmos limites e passo da função integrar); o LCB e o
+        # caminho reduzido do solver reutilizam estas amostras em vez de
+        # reavaliar o interpolador.
+        self._areas_x = self._wl_x
+        if self._areas_x is None:
+            passo = 0.001
+            self._areas_x = np.arange(self.x_re, self.x_vante + passo / 2, passo)
+        self._areas_amostradas = np.nan_to_num(
+            np.asarray(self.interpolador_areas(self._areas_x), dtype=np.float64), nan=0.0)
+        self.volume = self._integral_amostrada(self._areas_amostradas)
         
         # 4. Calcula o deslocamento (massa) a partir do volume e da densidade.
         self.deslocamento = self.volume * self.densidade
@@ -738,11 +1028,9 @@ class PropriedadesHidrostaticas:
             self.lcf = 0.0
             return
             
-        # Define a função a ser integrada: x * largura_total(x) = x * 2y(x)
-        funcao_momento_longitudinal = lambda x: x * (2 * self.interpolador_wl(x))
-        
-        # Integra para obter o momento longitudinal total da AWP.
-        momento_long_total = integrar(funcao_momento_longitudinal, self.x_re, self.x_vante)
+        # Momento longitudinal x * 2y(x) formado sobre as amostras já
+        # calculadas da linha d'água, sem nova passagem pelo interpolador.
+        momento_long_total = self._integral_amostrada(self._wl_x * (2.0 * self._wl_y))
         
         # LCF é o momento dividido pela área.
         self.lcf = momento_long_total / self.area_plano_flutuacao
@@ -760,11 +1048,9 @@ class PropriedadesHidrostaticas:
             self.lcb = 0.0
             return
             
-        # Define a função a ser integrada: x * Area(x).
-        funcao_momento_longitudinal = lambda x: x * self.interpolador_areas(x)
-        
-        # Integra para obter o momento longitudinal do volume.
-        momento_long_volume = integrar(funcao_momento_longitudinal, self.x_re, self.x_vante)
+        # Momento x * A(x) formado sobre as amostras da curva de áreas já
+        # guardadas pelo cálculo do volume, sem reavaliar o interpolador.
+        momento_long_volume = self._integral_amostrada(self._areas_x * self._areas_amostradas)
         
         # LCB é o momento de volume dividido pelo volume.
         self.lcb = momento_long_volume / self.volume
@@ -805,14 +1091,19 @@ class PropriedadesHidrostaticas:
             self.vcb = 0.0
             return
 
-        # 1. Calcular o momento vertical para cada seção transversal.
-        momentos_verticais = {}
-        funcao_perfil_casco = self.casco.funcao_perfil
-
-        for x, funcao_baliza in self.casco.funcoes_baliza.items():
-            # Limite inferior: altura da quilha em 'x'.
-            z_quilha = float(funcao_perfil_casco(x))
-            
+        # 1. Calcular o momento vertical de cada seção transversal. Em vez da
+        # quadratura adaptativa (quad), que cruza a fronteira Python/C num
+        # callback por ponto de amostragem, cada baliza submersa é amostrada
+        # na sua grade vertical (mesmo passo da função integrar) e todas as
+        # integrais de z * 2y(z) fecham numa única redução segmentada, como
+        # nas áreas de seção.
+        momentos_verticais = np.zeros(self.casco.x_balizas.size)
+        passo = 0.001
+        posicoes_submersas = []
+        blocos = []
+        tamanhos = []
+        for i, ((x, funcao_baliza), z_quilha) in enumerate(
+                zip(self.casco.funcoes_baliza.items(), self.casco.z_quilhas_balizas)):
             # Limite superior: calado (linha d'água) em 'x'.
             if self.prop_trim:
                 z_linha_dagua = self.prop_trim.calados_por_baliza[x]
@@ -820,22 +1111,25 @@ class PropriedadesHidrostaticas:
                 z_linha_dagua = self.calado
 
             if z_linha_dagua > z_quilha:
-                # A função a ser integrada é z * largura_total(z) = z * 2*y(z).
-                funcao_momento = lambda z: z * (2 * funcao_baliza(z))
-                
-                # Integra do fundo do casco (quilha) até a linha d'água.
-                momento_secao, _ = quad(funcao_momento, z_quilha, z_linha_dagua)
-                momentos_verticais[x] = momento_secao
-            else:
-                momentos_verticais[x] = 0.0
-            
-        # 2. Cria um interpolador para a curva de momentos verticais (Momento = f(x)).
-        x_pontos, momentos_pontos = zip(*sorted(momentos_verticais.items()))
-        
-        if self.casco.metodo_interp == 'pchip':
-            interpolador_momentos = PchipInterpolator(x_pontos, momentos_pontos, extrapolate=False)
-        else:
-            interpolador_momentos = interp1d(x_pontos, momentos_pontos, kind='linear', bounds_error=False, fill_value=0.0)
+                z_grade = np.arange(z_quilha, z_linha_dagua + passo / 2, passo)
+                if z_grade.size >= 2:
+                    posicoes_submersas.append(i)
+                    blocos.append(z_grade * (2.0 * funcao_baliza(z_grade)))
+                    tamanhos.append(z_grade.size)
+
+        if blocos:
+            y = np.nan_to_num(np.concatenate(blocos), nan=0.0)
+            tam = np.asarray(tamanhos)
+            inicios = np.concatenate(([0], np.cumsum(tam)[:-1]))
+            somas = np.add.reduceat(y, inicios)
+            momentos_verticais[posicoes_submersas] = (
+                passo * (somas - 0.5 * (y[inicios] + y[inicios + tam - 1])))
+
+        # 2. Cria um interpolador para a curva de momentos verticais
+        # (Momento = f(x)); os vetores SoA já estão ordenados por x, sem o
+        # zip(*sorted(...)) sobre itens de dicionário.
+        interpolador_momentos = self.casco.criar_interpolador(
+            self.casco.x_balizas, momentos_verticais)
 
         # 3. Integra a curva de momentos ao longo do LWL para obter o momento total do volume.
         momento_total_vertical = integrar(interpolador_momentos, self.x_re, self.x_vante)
@@ -857,11 +1151,8 @@ class PropriedadesHidrostaticas:
             self.momento_inercia_transversal = 0.0
             return
 
-        # Define a função a ser integrada: (2/3) * y(x)³.
-        funcao_momento_inercia = lambda x: (2/3) * (self.interpolador_wl(x)**3)
-        
-        # Integra para obter o momento de inércia transversal total.
-        self.momento_inercia_transversal = integrar(funcao_momento_inercia, self.x_re, self.x_vante)
+        # Integral de (2/3) * y(x)³ sobre as amostras já calculadas.
+        self.momento_inercia_transversal = self._integral_amostrada((2 / 3) * self._wl_y ** 3)
 
     def _calcular_momento_inercia_longitudinal(self):
         """
@@ -876,11 +1167,9 @@ class PropriedadesHidrostaticas:
             self.momento_inercia_longitudinal = 0.0
             return
             
-        # Define a função a ser integrada: (distância ao LCF)² * largura_total(x).
-        funcao_momento_inercia = lambda x: ((x - self.lcf)**2) * (2 * self.interpolador_wl(x))
-        
-        # Integra para obter o momento de inércia longitudinal total.
-        self.momento_inercia_longitudinal = integrar(funcao_momento_inercia, self.x_re, self.x_vante)
+        # Integral de (x - LCF)² * 2y(x) sobre as amostras já calculadas.
+        self.momento_inercia_longitudinal = self._integral_amostrada(
+            ((self._wl_x - self.lcf) ** 2) * (2.0 * self._wl_y))
 
     def _calcular_propriedades_derivadas(self):
         """
@@ -889,44 +1178,62 @@ class PropriedadesHidrostaticas:
         Após o cálculo das áreas, volumes, centros e momentos de inércia, este
         método calcula os parâmetros de estabilidade e os coeficientes de forma,
         que são relações adimensionais usadas para caracterizar a geometria do casco.
-        """        
-        # --- Estabilidade Transversal ---
-        # Raio metacêntrico transversal (BMt): I_T / Volume
-        self.bmt = self.momento_inercia_transversal / self.volume if self.volume > 1e-6 else 0.0
-        # Altura do metacentro transversal acima da quilha (KMt): VCB + BMt
-        self.kmt = self.vcb + self.bmt
-
-        # --- Estabilidade Longitudinal ---
-        # Raio metacêntrico longitudinal (BMl): I_L / Volume
-        self.bml = self.momento_inercia_longitudinal / self.volume if self.volume > 1e-6 else 0.0
-        # Altura do metacentro longitudinal acima da quilha (KMl): VCB + BMl
-        self.kml = self.vcb + self.bml
-
-        # --- Outras Propriedades Hidrostáticas ---
-        # Toneladas por Centímetro de Imersão (TPC): (AWP * densidade) / 100
+
+        A aritmética em si vive na função pura `_propriedades_derivadas`, que
+        recebe e devolve apenas escalares; aqui só se leem os valores base e
+        se atribuem os resultados.
+        """
+        (self.bmt, self.kmt, self.bml, self.kml, self.tpc, self.mtc,
+         self.cb, self.cp, self.cwp, self.cm) = _propriedades_derivadas(
+            self.volume, self.vcb,
+            self.momento_inercia_transversal, self.momento_inercia_longitudinal,
+            self.area_plano_flutuacao, self.lwl, self.bwl, self.calado,
+            self.densidade, float(self.areas_secoes.max(initial=0.0)))
+
+    def _calcular_propriedades_solver(self):
+        """
+        Caminho reduzido para o solver iterativo de flutuação.
+
+        Calcula apenas o que o passo de Newton consome — deslocamento, LCB,
+        MTC, LCF e TPC — amostrando os interpoladores longitudinais uma única
+        vez e extraindo as três integrais (momento da AWP, inércia
+        longitudinal e momento de volume) das mesmas amostras, em vez de uma
+        passagem completa por propriedade. As propriedades verticais e de
+        estabilidade transversal (VCB, inércia transversal, KMt) não são
+        recalculadas.
+        """
+        # Geometria base e interpoladores (linha d'água e curva de áreas)
+        self._calcular_dimensoes_linha_dagua()
+        self._calcular_area_plano_flutuacao()
+        self._calcular_area_secao()
+        self._calcular_volume_deslocamento()
+
         self.tpc = (self.area_plano_flutuacao * self.densidade) / 100.0
-        
-        # Momento para Trimestre em 1 cm (MTc): (I_L * densidade) / (100 * LWL)
-        self.mtc = (self.momento_inercia_longitudinal * self.densidade) / (100 * self.lwl) if self.lwl > 1e-6 else 0.0
-        
-        # --- Coeficientes de Forma ---
-        # Área da seção mestra (Am): a maior área de seção transversal calculada.
-        area_secao_mestra = max(self.areas_secoes.values()) if self.areas_secoes else 0.0
 
-        # Coeficiente de Bloco (Cb): Volume / (LWL * BWL * T)
-        denominador_bloco = self.lwl * self.bwl * self.calado
-        self.cb = self.volume / denominador_bloco if denominador_bloco > 1e-6 else 0.0
+        if self.x_re >= self.x_vante or not self.interpolador_wl:
+            self.lcf = 0.0
+            self.lcb = 0.0
+            self.momento_inercia_longitudinal = 0.0
+            self.mtc = 0.0
+            return
 
-        # Coeficiente Prismático (Cp): Volume / (Am * LWL)
-        denominador_prismatico = area_secao_mestra * self.lwl
-        self.cp = self.volume / denominador_prismatico if denominador_prismatico > 1e-6 else 0.0
-        
-        # Coeficiente do Plano de Flutuação (Cwp): AWP / (LWL * BWL)
-        denominador_plano_flutuacao = self.lwl * self.bwl
-        self.cwp = self.area_plano_flutuacao / denominador_plano_flutuacao if denominador_plano_flutuacao > 1e-6 else 0.0
+        # Reutiliza as amostragens densas já feitas: linha d'água em
+        # _calcular_area_plano_flutuacao e curva de áreas em
+        # _calcular_volume_deslocamento.
+        x = self._wl_x
+        larguras = 2.0 * self._wl_y
+        areas = self._areas_amostradas
+
+        # Integrais longitudinais fundidas sobre as mesmas amostras
+        if self.area_plano_flutuacao > 1e-6:
+            self.lcf = trapezoid(y=x * larguras, x=x) / self.area_plano_flutuacao
+        else:
+            self.lcf = 0.0
+        self.momento_inercia_longitudinal = trapezoid(y=((x - self.lcf) ** 2) * larguras, x=x)
+        self.lcb = trapezoid(y=x * areas, x=x) / self.volume if self.volume > 1e-6 else 0.0
 
-        # Coeficiente de Seção Mestra (Cm): Cb / Cp ou Am / (BWL * T)
-        self.cm = self.cb / self.cp if self.cp > 1e-6 else 0.0
+        # Derivadas consumidas pelo passo de Newton
+        self.mtc = (self.momento_inercia_longitudinal * self.densidade) / (100 * self.lwl) if self.lwl > 1e-6 else 0.0
 
     def _calcular_todas_propriedades(self):
         """
@@ -990,6 +1297,47 @@ def calcular_propriedades_para_um_calado(args):
         'Cwp': props.cwp, 'Cm': props.cm,
     }
 
+
+# Estado por processo do pool: o casco e a densidade são enviados uma única
+# vez a cada worker (via initializer), em vez de serializados junto com cada
+# tarefa individual.
+_worker_casco = None
+_worker_densidade = None
+
+
+def _preparar_worker(casco, densidade):
+    """
+    Inicializador de cada processo do pool.
+
+    Guarda o casco (com os caches de geometria já aquecidos) e a densidade em
+    variáveis do módulo; as tarefas subsequentes só precisam transportar o
+    calado.
+    """
+    global _worker_casco, _worker_densidade
+    _worker_casco = casco
+    _worker_densidade = densidade
+
+
+# Cache por processo das linhas hidrostáticas já calculadas: solvers
+# iterativos repetem calados com frequência e, em caso de acerto, o cálculo
+# inteiro do calado é dispensado. Chaveado também pelo id do casco para não
+# sobreviver a uma troca de geometria no mesmo worker.
+_worker_cache: Dict[Tuple[int, float, float], dict] = {}
+
+
+def _calcular_para_calado(calado):
+    """Tarefa mínima do pool: só o calado cruza a fronteira de processos."""
+    chave = (id(_worker_casco), float(calado), float(_worker_densidade))
+    resultado = _worker_cache.get(chave)
+    if resultado is None:
+        if len(_worker_cache) >= 2048:
+            _worker_cache.clear()
+        resultado = calcular_propriedades_para_um_calado(
+            (_worker_casco, calado, _worker_densidade))
+        _worker_cache[chave] = resultado
+    return resultado
+
+
 class CalculadoraHidrostatica:
     """
     Orquestra o cálculo das curvas hidrostáticas para múltiplos calados
@@ -1018,18 +1366,28 @@ class CalculadoraHidrostatica:
         """
         start_time = time.perf_counter()
         # print(f"\n-> Iniciando cálculo PARALELO para {len(lista_de_calados)} calados...")
-        
-        # Prepara a lista de tarefas. Cada tarefa é uma tupla de argumentos
-        # para a nossa função 'worker'.
-        tarefas = [(self.casco, calado, self.densidade) for calado in lista_de_calados]
-        
+
+        # Aquece os caches de geometria do casco (posições e alturas de
+        # quilha das balizas) antes da serialização: os valores viajam dentro
+        # do pickle e cada processo filho os reutiliza em vez de recalculá-los.
+        self.casco.x_balizas
+        self.casco.z_quilhas_balizas
+
         resultados = []
         # ProcessPoolExecutor gerencia um pool de processos (um para cada núcleo de CPU, por padrão),
-        # distribuindo as tarefas entre eles.
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            # O método 'map' aplica a função 'calcular_propriedades_para_um_calado'
-            # a cada item da lista 'tarefas' e coleta os resultados.
-            resultados = list(executor.map(calcular_propriedades_para_um_calado, tarefas))
+        # distribuindo as tarefas entre eles. O initializer envia o casco e a
+        # densidade uma única vez por processo; cada tarefa do 'map' carrega
+        # apenas o calado, em vez de uma cópia serializada do casco inteiro.
+        with concurrent.futures.ProcessPoolExecutor(
+                initializer=_preparar_worker,
+                initargs=(self.casco, self.densidade)) as executor:
+            # chunksize agrupa vários calados por despacho, amortizando o
+            # custo de IPC de cada tarefa em listas grandes de calados.
+            n_procs = os.cpu_count() or 1
+            chunksize = max(1, len(lista_de_calados) // (4 * n_procs))
+            resultados = list(executor.map(_calcular_para_calado,
+                                           lista_de_calados,
+                                           chunksize=chunksize))
             
         duration = time.perf_counter() - start_time
         print(f"-> Cálculo finalizado em {duration:.2f} segundos.")
@@ -1,6 +1,7 @@
 # src/io/file_handler.py
 
 import pandas as pd
+import numpy as np
 import os
 from typing import Any, Dict
 
@@ -24,15 +25,23 @@ class FileHandler:
             ValueError: Se o CSV não contiver as colunas esperadas ('x', 'y', 'z').
         """
         try:
-            df = pd.read_csv(caminho_arquivo)
+            # memory_map evita uma cópia intermediária do arquivo no parser C
+            # do pandas, e o usecols descarta as colunas alheias a x/y/z
+            # ainda no parser — elas nem chegam a ser convertidas. As colunas
+            # numéricas são convertidas de uma vez após a seleção, sem passar
+            # pela inferência coluna a coluna.
+            df = pd.read_csv(
+                caminho_arquivo, memory_map=True,
+                usecols=lambda coluna: coluna.strip().lower() in ('x', 'y', 'z'))
             # Normaliza os nomes das colunas para minúsculas e remove espaços
             df.columns = df.columns.str.strip().str.lower()
-            
+
             colunas_esperadas = {'x', 'y', 'z'}
             if not colunas_esperadas.issubset(df.columns):
                 raise ValueError(f"O arquivo CSV deve conter as colunas: {colunas_esperadas}")
-            
-            return df[list(colunas_esperadas)] # Garante a ordem
+
+            # Lista explícita (e não o set) para garantir a ordem x, y, z.
+            return df[['x', 'y', 'z']].astype('float64', copy=False)
 
         except FileNotFoundError:
             print(f"Erro: Arquivo não encontrado em '{caminho_arquivo}'")
@@ -60,39 +69,51 @@ class FileHandler:
         Raises:
             ValueError: Se uma baliza (estação 'x') intermediária possuir apenas um ponto.
         """
-        df = tabela_cotas.copy()
-        
-        # 1. Ordenação
-        df = df.sort_values(by=['x']).reset_index(drop=True)
-
-        # 2. Transformação do Referencial de Saída
+        # Monta um DataFrame novo apenas com as colunas x/y/z, copiando cada
+        # buffer individualmente: evita a cópia do frame inteiro (e do
+        # BlockManager) feita por .copy(), sem aliasar o frame do chamador.
+        df = pd.DataFrame(
+            {coluna: tabela_cotas[coluna].to_numpy(copy=True) for coluna in ('x', 'y', 'z')}
+        )
+
+        # 1. Transformação do Referencial de Saída
         # Assumimos que a entrada é sempre com x=0 na AP.
         # Se o usuário quer a saída referenciada ao meio-navio (MS), deslocamos os 'x'.
         if referencial_saida == 'Meio-navio':
             df['x'] -= lpp / 2
-        
-        # 3. Limpeza de Dados Duplicados
-        # Arredondar para evitar problemas de ponto flutuante
-        df = df.round({'x': 4, 'y': 4, 'z': 4})
-        df = df.drop_duplicates(subset=['x', 'y', 'z'], keep='first')
 
-        # 4. Validação de Estações com Ponto Único
-        contagem_pontos = df['x'].value_counts()
-        
+        # 2. Ordenação e Limpeza de Dados Duplicados
+        # Arredondar para evitar problemas de ponto flutuante: uma única
+        # passada vetorizada sobre o bloco contíguo das três colunas, em vez
+        # do df.round por coluna com cópia do DataFrame inteiro.
+        colunas_xyz = np.round(df[['x', 'y', 'z']].to_numpy(), 4)
+        df[['x', 'y', 'z']] = colunas_xyz
+        if len(df):
+            # Os valores arredondados a 4 casas viram inteiros exatos; um
+            # único lexsort ordena por (x, y, z) e a máscara de diferenças
+            # adjacentes elimina as linhas repetidas — sem o índice hash por
+            # tupla do drop_duplicates.
+            cotas_int = np.rint(colunas_xyz * 1e4).astype(np.int64)
+            ordem = np.lexsort((cotas_int[:, 2], cotas_int[:, 1], cotas_int[:, 0]))
+            cotas_ordenadas = cotas_int[ordem]
+            unicos = np.concatenate(
+                ([True], np.any(np.diff(cotas_ordenadas, axis=0) != 0, axis=1)))
+            df = df.iloc[ordem[unicos]].reset_index(drop=True)
+
+        # 3. Validação de Estações com Ponto Único
+        # A coluna 'x' já sai ordenada do lexsort, então a contagem por
+        # estação é o tamanho de cada trecho contíguo (np.unique com
+        # return_counts), sem o hashmap do value_counts.
+        estacoes, contagens = np.unique(df['x'].to_numpy(), return_counts=True)
+
         # Se houver mais de uma estação, identificamos as extremas
-        if len(contagem_pontos) > 1:
-            x_min = contagem_pontos.index.min()
-            x_max = contagem_pontos.index.max()
-            
-            # Filtra estações que não são as extremas e que têm menos de 2 pontos
-            estacoes_problematicas = contagem_pontos[
-                (contagem_pontos < 2) & 
-                (contagem_pontos.index != x_min) & 
-                (contagem_pontos.index != x_max)
-            ]
-            
-            if not estacoes_problematicas.empty:
-                lista_estacoes = ", ".join(map(str, estacoes_problematicas.index.tolist()))
+        if estacoes.size > 1:
+            # Estações que não são as extremas (primeira/última do vetor
+            # ordenado) e que têm menos de 2 pontos
+            problematicas = estacoes[1:-1][contagens[1:-1] < 2]
+
+            if problematicas.size:
+                lista_estacoes = ", ".join(map(str, problematicas.tolist()))
                 raise ValueError(f"Erro Crítico: As estações intermediárias {lista_estacoes} possuem apenas 1 ponto.")
 
         print("Validação da tabela de cotas concluída com sucesso.")
@@ -117,8 +138,11 @@ class FileHandler:
 
             # Salva o DataFrame em CSV
             # index=False: para não salvar o índice do DataFrame como uma coluna.
-            # float_format: para garantir uma formatação consistente dos números.
-            df_resultados.to_csv(caminho_arquivo, index=False, float_format='%.4f')
+            # O arredondamento a 4 casas é feito de uma vez, vetorizado, e o
+            # escritor usa a conversão nativa de floats — sem formatar cada
+            # célula individualmente em Python com float_format (zeros à
+            # direita deixam de ser preenchidos).
+            df_resultados.round(4).to_csv(caminho_arquivo, index=False)
             print(f"\n-> Resultados salvos com sucesso em: '{caminho_arquivo}'")
 
         except IOError as e:
@@ -142,38 +166,51 @@ class FileHandler:
             if not os.path.exists(pasta_destino):
                 os.makedirs(pasta_destino)
 
-            # Usamos 'with' para garantir que o arquivo seja fechado corretamente
-            with open(caminho_arquivo, 'w', encoding='utf-8') as f:
-                f.write("="*60 + "\n")
-                f.write("RELATÓRIO FINAL DA PROVA DE INCLINAÇÃO\n")
-                f.write("="*60 + "\n\n")
-
-                # Bloco 1: Condição de Navio Leve
-                if hasattr(calculadora_rpi, 'navio_leve_resultados'):
-                    f.write("--- 1. CONDIÇÃO DE NAVIO LEVE ---\n")
-                    for chave, valor in calculadora_rpi.navio_leve_resultados.items():
-                        f.write(f"{chave:<28}: {valor:.4f}\n")
-                    f.write("\n")
-                else:
-                    f.write("--- 1. CONDIÇÃO DE NAVIO LEVE (DADOS NÃO ENCONTRADOS) ---\n\n")
-
-                # Bloco 2: Flutuação na Condição de Navio Leve
-                if hasattr(calculadora_rpi, 'flutuacao_navio_leve'):
-                    f.write("--- 2. FLUTUAÇÃO NA CONDIÇÃO DE NAVIO LEVE ---\n")
-                    for chave, valor in calculadora_rpi.flutuacao_navio_leve.items():
-                        f.write(f"{chave:<28}: {valor:.4f}\n")
-                    f.write("\n")
-                else:
-                    f.write("--- 2. FLUTUAÇÃO (DADOS NÃO ENCONTRADOS) ---\n\n")
-
-                # Bloco 3: Hidrostáticas na Condição de Navio Leve
-                if hasattr(calculadora_rpi, 'hidrostaticos_navio_leve'):
-                    f.write("--- 3. HIDROSTÁTICAS NA CONDIÇÃO DE NAVIO LEVE ---\n")
-                    for chave, valor in calculadora_rpi.hidrostaticos_navio_leve.items():
-                        f.write(f"{chave:<28}: {valor:.4f}\n")
-                    f.write("\n")
-                else:
-                    f.write("--- 3. HIDROSTÁTICAS (DADOS NÃO ENCONTRADOS) ---\n\n")
+            # As linhas são acumuladas em uma lista e escritas de uma vez com
+            # writelines: uma única chamada ao stream por relatório, em vez de
+            # um f.write por entrada de dicionário.
+            partes = []
+            partes.append("="*60 + "\n")
+            partes.append("RELATÓRIO FINAL DA PROVA DE INCLINAÇÃO\n")
+            partes.append("="*60 + "\n\n")
+
+            # Bloco 1: Condição de Navio Leve
+            if getattr(calculadora_rpi, 'navio_leve_resultados', None) is not None:
+                partes.append("--- 1. CONDIÇÃO DE NAVIO LEVE ---\n")
+                partes.extend(
+                    f"{chave:<28}: {valor:.4f}\n"
+                    for chave, valor in calculadora_rpi.navio_leve_resultados.as_dict().items()
+                )
+                partes.append("\n")
+            else:
+                partes.append("--- 1. CONDIÇÃO DE NAVIO LEVE (DADOS NÃO ENCONTRADOS) ---\n\n")
+
+            # Bloco 2: Flutuação na Condição de Navio Leve
+            if getattr(calculadora_rpi, 'flutuacao_navio_leve', None) is not None:
+                partes.append("--- 2. FLUTUAÇÃO NA CONDIÇÃO DE NAVIO LEVE ---\n")
+                partes.extend(
+                    f"{chave:<28}: {valor:.4f}\n"
+                    for chave, valor in calculadora_rpi.flutuacao_navio_leve.as_dict().items()
+                )
+                partes.append("\n")
+            else:
+                partes.append("--- 2. FLUTUAÇÃO (DADOS NÃO ENCONTRADOS) ---\n\n")
+
+            # Bloco 3: Hidrostáticas na Condição de Navio Leve
+            if hasattr(calculadora_rpi, 'hidrostaticos_navio_leve'):
+                partes.append("--- 3. HIDROSTÁTICAS NA CONDIÇÃO DE NAVIO LEVE ---\n")
+                partes.extend(
+                    f"{chave:<28}: {valor:.4f}\n"
+                    for chave, valor in calculadora_rpi.hidrostaticos_navio_leve.items()
+                )
+                partes.append("\n")
+            else:
+                partes.append("--- 3. HIDROSTÁTICAS (DADOS NÃO ENCONTRADOS) ---\n\n")
+
+            # Usamos 'with' para garantir que o arquivo seja fechado corretamente.
+            # Buffer de 1 MiB para que o relatório saia em poucas chamadas de sistema.
+            with open(caminho_arquivo, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(partes)
 
             print(f"\n-> Relatório RPI salvo com sucesso em: '{caminho_arquivo}'")
 
@@ -195,50 +232,67 @@ class FileHandler:
             pasta_destino = os.path.dirname(caminho_arquivo)
             os.makedirs(pasta_destino, exist_ok=True)
 
-            with open(caminho_arquivo, 'w', encoding='utf-8') as f:
-                f.write("="*80 + "\n")
-                f.write("RELATÓRIO FINAL - ESTUDO DE ESTABILIDADE DEFINITIVO (EED)\n")
-                f.write("="*80 + "\n")
-                f.write(f"\nÁrea de Navegação Considerada: {verificador.area_navegação}\n")
+            # Mesmo esquema do relatório RPI: as linhas são acumuladas em uma
+            # lista e gravadas com poucos writelines, em vez de dezenas de
+            # f.write pequenos por condição de carregamento. As tabelas do
+            # pandas são despejadas direto no arquivo (to_string(buf=f)),
+            # sem materializar a string formatada inteira em memória.
+            # Buffer de 1 MiB: o relatório inteiro sai em poucas chamadas de sistema.
+            with open(caminho_arquivo, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                partes = []
+                partes.append("="*80 + "\n")
+                partes.append("RELATÓRIO FINAL - ESTUDO DE ESTABILIDADE DEFINITIVO (EED)\n")
+                partes.append("="*80 + "\n")
+                partes.append(f"\nÁrea de Navegação Considerada: {verificador.area_navegação}\n")
 
                 # Escreve a Tabela de Pesos e Centros completa (base para todos os cálculos)
-                f.write("\n--- TABELA DE PESOS E CENTROS GERAL ---\n")
+                partes.append("\n--- TABELA DE PESOS E CENTROS GERAL ---\n")
+                f.writelines(partes)
+                partes.clear()
                 df_pesos = pd.DataFrame(calculadora_eed.tabela_pesos)
-                f.write(df_pesos.to_string(index=False))
-                f.write("\n\n" + "="*80 + "\n")
+                df_pesos.to_string(buf=f, index=False)
+                partes.append("\n\n" + "="*80 + "\n")
 
                 # Itera sobre cada condição de carregamento
                 for nome_cond, dados_cond in calculadora_eed.resultados_condicoes.items():
-                    f.write(f"\n--- ANÁLISE DA CONDIÇÃO: {nome_cond} ---\n")
+                    partes.append(f"\n--- ANÁLISE DA CONDIÇÃO: {nome_cond} ---\n")
 
                     # 1. Resumo da Condição
-                    f.write("\n  1. Resumo da Condição de Carregamento:\n")
-                    f.write(f"    - Peso Total (Deslocamento): {dados_cond.get('peso_total', 0.0):.4f} t\n")
-                    f.write(f"    - LCG da Condição:             {dados_cond.get('lcg_condicao', 0.0):.4f} m\n")
-                    f.write(f"    - KG da Condição:              {dados_cond.get('kg_condicao', 0.0):.4f} m\n")
+                    partes.append("\n  1. Resumo da Condição de Carregamento:\n")
+                    partes.append(f"    - Peso Total (Deslocamento): {dados_cond.get('peso_total', 0.0):.4f} t\n")
+                    partes.append(f"    - LCG da Condição:             {dados_cond.get('lcg_condicao', 0.0):.4f} m\n")
+                    partes.append(f"    - KG da Condição:              {dados_cond.get('kg_condicao', 0.0):.4f} m\n")
 
                     # 2. Características Hidrostáticas
                     if 'hidrostaticos' in dados_cond:
-                        f.write("\n  2. Características Hidrostáticas:\n")
-                        for chave, valor in dados_cond['hidrostaticos'].items():
-                            f.write(f"    - {chave:<28}: {valor:.4f}\n")
+                        partes.append("\n  2. Características Hidrostáticas:\n")
+                        partes.extend(
+                            f"    - {chave:<28}: {valor:.4f}\n"
+                            for chave, valor in dados_cond['hidrostaticos'].items()
+                        )
 
                     # 3. Curva de Estabilidade (GZ)
                     if 'curva_gz' in dados_cond:
-                        f.write("\n  3. Curva de Estabilidade Estática (GZ):\n")
+                        partes.append("\n  3. Curva de Estabilidade Estática (GZ):\n")
                         # Para economizar espaço, podemos mostrar apenas alguns pontos ou a tabela completa
-                        f.write(dados_cond['curva_gz'].to_string(index=False))
-                        f.write("\n")
+                        f.writelines(partes)
+                        partes.clear()
+                        dados_cond['curva_gz'].to_string(buf=f, index=False)
+                        partes.append("\n")
 
                     # 4. Verificação dos Critérios
                     if nome_cond in resultados_verificacao:
-                        f.write("\n  4. Verificação de Critérios de Estabilidade:\n")
-                        for criterio, resultado in resultados_verificacao[nome_cond].items():
-                            status = "PASSOU" if resultado['passou'] else "FALHOU"
-                            linha = f"    - {criterio:<22} | Valor: {resultado['valor']:<18} | Esperado: {resultado['esperado']:<18} | Status: {status}\n"
-                            f.write(linha)
-                    
-                    f.write("\n" + "="*80 + "\n")
+                        partes.append("\n  4. Verificação de Critérios de Estabilidade:\n")
+                        partes.extend(
+                            f"    - {criterio:<22} | Valor: {resultado['valor']:<18} | "
+                            f"Esperado: {resultado['esperado']:<18} | "
+                            f"Status: {'PASSOU' if resultado['passou'] else 'FALHOU'}\n"
+                            for criterio, resultado in resultados_verificacao[nome_cond].items()
+                        )
+
+                    partes.append("\n" + "="*80 + "\n")
+
+                f.writelines(partes)
 
             print(f"\n-> Relatório EED salvo com sucesso em: '{caminho_arquivo}'")
 
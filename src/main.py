@@ -153,7 +153,10 @@ def main():
         # 3. PASSO FINAL E CRÍTICO: Calcular a condição de Navio Leve
         # Este método utiliza os resultados dos passos anteriores para o cálculo final
         calculadora_rpi.calcular_condicao_navio_leve()
-        navio_leve_resultados = calculadora_rpi.navio_leve_resultados
+        # O menu e o módulo de estabilidade consomem os resultados como
+        # dicionário, por isso usamos o adaptador as_dict() da dataclass.
+        if calculadora_rpi.navio_leve_resultados is not None:
+            navio_leve_resultados = calculadora_rpi.navio_leve_resultados.as_dict()
 
         # 4. Exibir o resultado final e mais importante do RPI
         print("\n" + "="*50)
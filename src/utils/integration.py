@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.integrate import trapezoid
 from typing import Callable
 
 def integrar(
@@ -48,8 +47,10 @@ def integrar(
     # Substituímos quaisquer NaNs por 0.0 para não afetar a soma da área.
     pontos_y = np.nan_to_num(pontos_y, nan=0.0)
 
-    # Calcula a área utilizando a função trapezoid da SciPy, que implementa
-    # a regra numérica de forma eficiente.
-    area = trapezoid(y=pontos_y, x=pontos_x)
+    # Como a grade é uniforme (espaçamento = passo), a regra do trapézio
+    # reduz-se à forma fechada passo * (soma - metade das extremidades):
+    # uma única redução em C, sem calcular diferenças de x nem alocar os
+    # arrays intermediários da rotina genérica da SciPy.
+    area = passo * (pontos_y.sum() - 0.5 * (pontos_y[0] + pontos_y[-1]))
 
-    return area
\ No newline at end of file
+    return float(area)
\ No newline at end of file